@@ -0,0 +1,87 @@
+"""
+Per-minute activity counters for live teacher monitoring.
+
+Every graded attempt increments one document per (class, section, minute):
+
+    {"class_name": "GR9-A", "section_id": "section2", "minute": <datetime>,
+     "attempts": 14, "correct": 9, "stage_updates": 3, "students": ["ali", "sara", ...]}
+
+so "what happened in the last N minutes" reads at most N documents per class
+and section instead of scanning progress. A TTL index on `minute` drops old
+buckets after ACTIVITY_RETENTION_HOURS.
+
+Stage completions posted to /updateProgress are counted as stage_updates, not
+as attempts, but still make the student active.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+ACTIVITY_RETENTION_HOURS = int(os.environ.get('ACTIVITY_RETENTION_HOURS', '48'))
+COUNTERS = ("attempts", "correct", "stage_updates")
+
+def minute_of(timestamp: datetime) -> datetime:
+    return timestamp.replace(second=0, microsecond=0)
+
+async def ensure_activity_indexes(collection):
+    await collection.create_index(
+        [("class_name", 1), ("section_id", 1), ("minute", 1)], unique=True
+    )
+    await collection.create_index("minute", expireAfterSeconds=ACTIVITY_RETENTION_HOURS * 3600)
+
+async def record(collection, class_name: str, section_id: str, username: str, correct: bool = False,
+                 at: Optional[datetime] = None, stage_update: bool = False):
+    minute = minute_of(at or datetime.utcnow())
+    increments = {"stage_updates": 1} if stage_update else {"attempts": 1, "correct": int(correct)}
+    await collection.update_one(
+        {"class_name": class_name, "section_id": section_id, "minute": minute},
+        {"$inc": increments, "$addToSet": {"students": username}},
+        upsert=True,
+    )
+
+async def recent_activity(collection, minutes: int, class_filter: Optional[str] = None) -> Dict:
+    """Totals, active students and a per-minute series for the last `minutes` minutes"""
+    now = datetime.utcnow()
+    since = minute_of(now) - timedelta(minutes=minutes - 1)
+    query = {"minute": {"$gte": since}}
+    if class_filter:
+        query["class_name"] = class_filter
+    buckets = await collection.find(query, {"_id": 0}).sort("minute", 1).to_list(None)
+
+    def empty() -> Dict:
+        return {**{counter: 0 for counter in COUNTERS}, "students": set()}
+
+    series: Dict[datetime, Dict] = {}
+    sections: Dict[str, Dict] = {}
+    active = set()
+    for bucket in buckets:
+        point = series.setdefault(bucket["minute"], empty())
+        section = sections.setdefault(bucket["section_id"], empty())
+        for target in (point, section):
+            for counter in COUNTERS:
+                target[counter] += bucket.get(counter, 0)
+            target["students"].update(bucket.get("students", []))
+        active.update(bucket.get("students", []))
+
+    def counts(values: Dict) -> Dict:
+        return {**{counter: values[counter] for counter in COUNTERS}, "active_students": len(values["students"])}
+
+    minutes_list: List[Dict] = []
+    for offset in range(minutes):
+        minute = since + timedelta(minutes=offset)
+        values = series.get(minute, empty())
+        minutes_list.append({"minute": minute, **counts(values)})
+
+    return {
+        "class_filter": class_filter,
+        "minutes": minutes,
+        "since": since,
+        "attempts": sum(point["attempts"] for point in minutes_list),
+        "correct": sum(point["correct"] for point in minutes_list),
+        "stage_updates": sum(point["stage_updates"] for point in minutes_list),
+        "active_students": sorted(active),
+        "active_count": len(active),
+        "sections": {section_id: counts(values) for section_id, values in sorted(sections.items())},
+        "series": minutes_list,
+    }
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Backend benchmark suite
+
+Usage (from the backend directory, with MONGO_URL and DB_NAME set):
+    python benchmark.py payloads
+    python benchmark.py startup
+    python benchmark.py load --concurrency 1,8,32,64
+    python benchmark.py layouts --students 2000
+    python benchmark.py dashboard
+    python benchmark.py normalize --budget-ms 5
+    python benchmark.py grading --grading-workers 4 --expensive-ms 50
+    python benchmark.py all
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+def measure(fn, repeat: int = 200) -> float:
+    """Median wall time of fn() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+async def measure_async(fn, repeat: int = 200) -> float:
+    """Median wall time of await fn() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def print_table(title: str, header: list, rows: list):
+    print(f"\n{title}")
+    print("-" * len(title))
+    widths = [max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+
+async def bench_payloads(args):
+    """Payload size and serialization latency of full vs language-projected problem lists"""
+    from catalog import dump_json, project_language, CatalogPayload, catalog_response
+    from database import get_section_problems
+    from models import Language
+
+    rows = []
+    for section_num in range(1, 6):
+        section_id = f"section{section_num}"
+        problems = [p.model_dump(mode="json") for p in await get_section_problems(section_id)]
+        if not problems:
+            continue
+
+        for lang in (None, Language.EN, Language.AR):
+            content = project_language(problems, lang) if lang else problems
+            body = dump_json(content)
+            payload = CatalogPayload(0, body)
+            payload.encoded("gzip")
+
+            serialize_ms = measure(
+                lambda: dump_json(project_language(problems, lang) if lang else problems),
+                args.repeat,
+            )
+            cached_ms = measure(lambda: catalog_response(payload, "gzip"), args.repeat)
+            rows.append([
+                section_id,
+                lang.value if lang else "both",
+                len(body),
+                len(gzip.compress(body)),
+                f"{serialize_ms:.3f}",
+                f"{cached_ms:.4f}",
+            ])
+
+    print_table(
+        "Section payloads (bytes, median ms)",
+        ["section", "lang", "raw", "gzip", "serialize", "cached"],
+        rows,
+    )
+
+def _poll(url: str, deadline: float, expect_ok: bool = True):
+    """Poll url until it answers (with 2xx when expect_ok), return the decoded body"""
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            if not expect_ok:
+                return json.loads(e.read())
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} did not answer in time")
+
+def _start_server(args, **env) -> subprocess.Popen:
+    """Spawn a single uvicorn worker on args.port with extra environment variables"""
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(args.port)],
+        env=dict(os.environ, **env), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+async def bench_startup(args):
+    """Time-to-first-request and time-to-ready of a fresh uvicorn process per startup mode"""
+    rows = []
+    for mode in ("blocking", "background"):
+        started = time.monotonic()
+        process = _start_server(args, STARTUP_MODE=mode)
+        try:
+            deadline = started + 60
+            base = f"http://127.0.0.1:{args.port}/api"
+            _poll(f"{base}/", deadline)
+            first_request_ms = (time.monotonic() - started) * 1000
+            while not _poll(f"{base}/ready", deadline, expect_ok=False)["ready"]:
+                time.sleep(0.05)
+            ready_ms = (time.monotonic() - started) * 1000
+            rows.append([mode, f"{first_request_ms:.0f}", f"{ready_ms:.0f}"])
+        finally:
+            process.terminate()
+            process.wait()
+
+    print_table(
+        "Startup (ms since process spawn)",
+        ["mode", "first request", "ready"],
+        rows,
+    )
+
+def _request(url: str, payload: dict = None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read())
+
+def _student_session(base: str, username: str, deadline: float) -> list:
+    """Submit attempts and reload progress until the deadline; returns (latency ms, ok) samples"""
+    samples = []
+    while time.monotonic() < deadline:
+        for url, payload in (
+            (f"{base}/students/{username}/attempt", {"problem_id": "prep1", "answer": "0"}),
+            (f"{base}/students/{username}/progress", None),
+        ):
+            start = time.perf_counter()
+            try:
+                _request(url, payload)
+                ok = True
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                ok = False
+            samples.append(((time.perf_counter() - start) * 1000, ok))
+    return samples
+
+async def bench_load(args):
+    """Request latency and pool checkout waits of one uvicorn worker at increasing concurrency"""
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from mongo_pool import client_options
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    # The server runs against a scratch database, dropped afterwards
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"], **client_options())
+    db_name = f"{os.environ.get('DB_NAME', 'mathtutor')}_load_bench"
+    await client.drop_database(db_name)
+    process = _start_server(args, STARTUP_MODE="blocking", DB_NAME=db_name)
+    base = f"http://127.0.0.1:{args.port}/api"
+    rows = []
+    try:
+        _poll(f"{base}/ready", time.monotonic() + 60)
+        usernames = [f"loadtest_{i}" for i in range(max(levels))]
+        for i, username in enumerate(usernames):
+            _request(f"{base}/auth/student-login", {"username": username, "class_name": f"GR9-{'ABCD'[i % 4]}"})
+
+        for concurrency in levels:
+            _request(f"{base}/admin/pool-stats?reset=true")
+            deadline = time.monotonic() + args.duration
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = executor.map(lambda u: _student_session(base, u, deadline), usernames[:concurrency])
+                samples = [sample for session in results for sample in session]
+            # Attempts and progress reads go through the API client's pool
+            pools = _request(f"{base}/admin/pool-stats")["pools"].get("api", {}).values()
+
+            latencies = sorted(latency for latency, _ in samples)
+            errors = sum(1 for _, ok in samples if not ok)
+            checkouts = sum(pool["checkouts"] for pool in pools)
+            rows.append([
+                concurrency,
+                f"{len(samples) / args.duration:.0f}",
+                f"{statistics.median(latencies):.1f}",
+                f"{latencies[int(len(latencies) * 0.95)]:.1f}",
+                errors,
+                max((pool["max_in_use"] for pool in pools), default=0),
+                f"{sum(pool['wait_total_ms'] for pool in pools) / checkouts:.3f}" if checkouts else "-",
+                f"{max((pool['wait_p95_ms'] for pool in pools), default=0):.3f}",
+                f"{max((pool['wait_max_ms'] for pool in pools), default=0):.3f}",
+            ])
+    finally:
+        process.terminate()
+        process.wait()
+        await client.drop_database(db_name)
+        client.close()
+
+    print_table(
+        f"Load ({args.duration:.0f}s per level, request ms / pool checkout wait ms)",
+        ["concurrency", "req/s", "p50", "p95", "errors", "conns in use", "wait avg", "wait p95", "wait max"],
+        rows,
+    )
+
+async def bench_layouts(args):
+    """Read/write latency and storage size of the rows and document progress layouts"""
+    import random
+    from datetime import datetime
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from content import load_curriculum
+    from mongo_pool import client_options
+    from progress_store import document_from_rows, progress_layout
+
+    # Scratch database, dropped afterwards
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"], **client_options())
+    db_name = f"{os.environ.get('DB_NAME', 'mathtutor')}_layout_bench"
+    await client.drop_database(db_name)
+    db = client[db_name]
+
+    problems = load_curriculum().problems
+    usernames = [f"bench_{i}" for i in range(args.students)]
+    now = datetime.utcnow()
+    for start in range(0, len(usernames), 100):
+        rows = [
+            {"student_username": username, "section_id": p.section_id, "problem_id": p.id,
+             "completed": random.random() < 0.6, "score": random.choice([0, 40, 60, 80, 100]),
+             "attempts": random.randint(0, 5), "hints_used": random.randint(0, 2),
+             "last_attempt": now, "first_attempt": now}
+            for username in usernames[start:start + 100] for p in problems
+        ]
+        await db.progress.insert_many([dict(row) for row in rows])
+        await db.progress_by_student.insert_many([
+            document_from_rows(username, [r for r in rows if r["student_username"] == username])
+            for username in usernames[start:start + 100]
+        ])
+    await db.progress.create_index([("student_username", 1), ("problem_id", 1)])
+
+    rows = []
+    try:
+        for name in ("rows", "document"):
+            store = progress_layout(db, name)
+            read_ms = await measure_async(lambda: store.read(random.choice(usernames)), args.repeat)
+            section_ms = await measure_async(
+                lambda: store.read(random.choice(usernames), ["prep1", "explanation1", "practice1_1"]), args.repeat
+            )
+
+            async def write():
+                problem = random.choice(problems)
+                await store.write(random.choice(usernames), problem.id, {
+                    "section_id": problem.section_id, "completed": True, "score": 80,
+                    "attempts": 2, "hints_used": 0, "last_attempt": datetime.utcnow(),
+                })
+            write_ms = await measure_async(write, args.repeat)
+
+            collection = "progress" if name == "rows" else "progress_by_student"
+            stats = await db.command("collStats", collection)
+            rows.append([
+                name, f"{read_ms:.3f}", f"{section_ms:.3f}", f"{write_ms:.3f}",
+                stats["count"], f"{stats['size'] / 1024:.0f}",
+                f"{stats['storageSize'] / 1024:.0f}", f"{stats['totalIndexSize'] / 1024:.0f}",
+            ])
+    finally:
+        await client.drop_database(db_name)
+        client.close()
+
+    print_table(
+        f"Progress layouts ({args.students} students x {len(problems)} problems, median ms, KiB)",
+        ["layout", "read", "read section", "write", "documents", "data", "storage", "indexes"],
+        rows,
+    )
+
+async def bench_dashboard(args):
+    """Size and serialization time of the teacher dashboard rows vs format=columnar"""
+    import random
+    from datetime import datetime
+    from catalog import dump_json
+    from content import load_curriculum
+    from server import columnar_students
+
+    problem_ids = [p.id for p in load_curriculum().problems]
+    rows = []
+    for class_size in (30, 120, 500):
+        stats = [
+            {
+                "username": f"student_{i}", "class_name": "GR9-A",
+                "progress_percentage": random.uniform(0, 100), "completed_problems": random.randint(0, 30),
+                "total_problems": len(problem_ids), "weighted_score": random.uniform(0, 100),
+                "total_attempts": random.randint(0, 90), "last_activity": datetime.utcnow().isoformat(),
+                "problems_status": {
+                    problem_id: {"completed": random.random() < 0.5, "score": random.choice([0, 60, 100]),
+                                 "attempts": random.randint(0, 4)}
+                    for problem_id in problem_ids
+                },
+            }
+            for i in range(class_size)
+        ]
+        row_body = dump_json(stats)
+        columnar_body = dump_json(columnar_students(stats))
+        rows.append([
+            class_size,
+            len(row_body), len(columnar_body),
+            len(gzip.compress(row_body)), len(gzip.compress(columnar_body)),
+            f"{measure(lambda: dump_json(stats), args.repeat):.3f}",
+            f"{measure(lambda: dump_json(columnar_students(stats)), args.repeat):.3f}",
+        ])
+
+    print_table(
+        "Dashboard students (bytes, median ms to build + serialize)",
+        ["students", "rows", "columnar", "rows gzip", "columnar gzip", "rows ms", "columnar ms"],
+        rows,
+    )
+
+def adversarial_answers(length: int, samples: int = 50):
+    """Inputs aimed at backtracking in the normalization patterns, plus random fuzz"""
+    import random
+    rng = random.Random(length)
+    half = length // 2
+    yield "unclosed number", "(" + "1" * (length - 1)
+    yield "unclosed decimal", "(-" + "1" * half + "." + " " * (length - half - 3)
+    yield "nested parens", "(" * half + "1" * (length - half)
+    yield "repeated parens", "( 1" * (length // 3)
+    yield "spaces", " " * (length - 1) + "x"
+    yield "spaced operators", " + < =" * (length // 6)
+    yield "arabic", "(-٣س ≥ ١٢)" * (length // 10)
+    alphabet = "0123456789.-+*/=<>≤≥()xس٣ \t"
+    for _ in range(samples):
+        yield "fuzz", "".join(rng.choice(alphabet) for _ in range(length))
+
+async def bench_normalize(args):
+    """Worst-case answer normalization time on adversarial input; fails above --budget-ms"""
+    from utils import MAX_ANSWER_LENGTH, normalize_answer
+
+    # 10x and 100x the accepted length show that the time grows linearly
+    lengths = (MAX_ANSWER_LENGTH, MAX_ANSWER_LENGTH * 10, MAX_ANSWER_LENGTH * 100)
+    worst = {}
+    for scale, length in enumerate(lengths):
+        for family, answer in adversarial_answers(length):
+            start = time.perf_counter()
+            normalize_answer(answer, "preparation", "x = 7")
+            elapsed = (time.perf_counter() - start) * 1000
+            worst.setdefault(family, [0.0] * len(lengths))
+            worst[family][scale] = max(worst[family][scale], elapsed)
+
+    print_table(
+        f"Answer normalization (worst ms; budget {args.budget_ms} ms at {MAX_ANSWER_LENGTH} chars, scaled linearly)",
+        ["input"] + [f"{length} chars" for length in lengths],
+        [[family] + [f"{ms:.3f}" for ms in times] for family, times in worst.items()],
+    )
+    over = [
+        f"{family} at {length} chars: {times[i]:.3f} ms"
+        for family, times in worst.items()
+        for i, length in enumerate(lengths)
+        if times[i] > args.budget_ms * length / MAX_ANSWER_LENGTH
+    ]
+    if over:
+        raise SystemExit("Normalization over budget: " + "; ".join(over))
+
+def burn_cpu(milliseconds: float) -> int:
+    """Stand-in for an expensive check such as symbolic equivalence"""
+    deadline = time.perf_counter() + milliseconds / 1000
+    spins = 0
+    while time.perf_counter() < deadline:
+        spins += 1
+    return spins
+
+async def _loop_lag(stop: asyncio.Event, interval: float = 0.005) -> list:
+    """How late (ms) the event loop wakes up from short sleeps until `stop` is set"""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+    return lags
+
+async def bench_grading(args):
+    """Event-loop lag while grading a mix of cheap and expensive answers, inline vs in the process pool"""
+    from grading import GradingExecutor, grade_values
+
+    clients, calls_per_client = 16, 20
+    rows = []
+    for workers in (0, args.grading_workers):
+        executor = GradingExecutor(workers=workers, timeout=60)
+        await executor.start()
+
+        async def client():
+            for call in range(calls_per_client):
+                # Every tenth answer needs the expensive check, the rest are string compares
+                if call % 10 == 0:
+                    await executor.run(burn_cpu, args.expensive_ms)
+                else:
+                    grade_values("practice", "x < 5", "x<5")
+                await asyncio.sleep(0)
+
+        stop = asyncio.Event()
+        monitor = asyncio.create_task(_loop_lag(stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        lags = sorted(await monitor)
+        executor.stop()
+
+        rows.append([
+            f"pool x{workers}" if workers else "inline",
+            clients * calls_per_client,
+            f"{clients * calls_per_client / elapsed:.0f}",
+            f"{statistics.median(lags):.2f}",
+            f"{lags[int(len(lags) * 0.99) - 1]:.2f}",
+            f"{lags[-1]:.2f}",
+        ])
+
+    print_table(
+        f"Grading with 1 in 10 answers costing {args.expensive_ms} ms of CPU (event-loop lag in ms)",
+        ["executor", "answers", "answers/s", "lag p50", "lag p99", "lag max"],
+        rows,
+    )
+
+BENCHMARKS = {
+    "payloads": bench_payloads,
+    "startup": bench_startup,
+    "load": bench_load,
+    "layouts": bench_layouts,
+    "dashboard": bench_dashboard,
+    "normalize": bench_normalize,
+    "grading": bench_grading,
+}
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run backend benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS) + ["all"])
+    parser.add_argument("--repeat", type=int, default=200, help="Samples per measurement")
+    parser.add_argument("--port", type=int, default=8765, help="Port for benchmarks that start a server")
+    parser.add_argument("--concurrency", default="1,8,32,64", help="Comma-separated client counts for the load test")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per load test level")
+    parser.add_argument("--students", type=int, default=1000, help="Synthetic students for the layout benchmark")
+    parser.add_argument("--grading-workers", type=int, default=4, help="Pool processes for the grading benchmark")
+    parser.add_argument("--expensive-ms", type=float, default=50, help="CPU time of an expensive grading check")
+    parser.add_argument("--budget-ms", type=float, default=5, help="Normalization time budget per answer of the maximum length")
+    args = parser.parse_args()
+
+    selected = BENCHMARKS.values() if args.benchmark == "all" else [BENCHMARKS[args.benchmark]]
+    for benchmark in selected:
+        await benchmark(args)
+
+if __name__ == "__main__":
+    asyncio.run(main())
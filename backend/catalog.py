@@ -0,0 +1,150 @@
+import json
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import Response
+
+from compression import MIN_COMPRESS_SIZE, choose_encoding, compress_body
+from database import get_section_problems, get_problem, load_catalog_version, load_problem_id_renames
+from models import Language
+
+# Catalog payloads are immutable between curriculum changes, so they are
+# serialized once per catalog version and language and reused by every request.
+# The version lives in the database so every worker notices a curriculum sync.
+CATALOG_VERSION_TTL = float(os.environ.get('CATALOG_VERSION_TTL', '30'))
+_catalog_version = 0
+_version_checked_at = None
+_section_payloads: Dict[Tuple[str, Optional[str]], "CatalogPayload"] = {}
+_problem_payloads: Dict[Tuple[str, Optional[str]], "CatalogPayload"] = {}
+
+# Language-neutral fields that have an *_ar twin but are still needed by
+# Arabic clients (the canonical answer is used for client-side checking)
+SHARED_FIELDS = {"answer"}
+
+def dump_json(content) -> bytes:
+    """Serialize the same way FastAPI's JSONResponse does"""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+def project_language(data, lang: Language):
+    """
+    Keep only the fields of one language in a serialized problem.
+    For lang=en the *_ar fields are dropped; for lang=ar the *_en fields and
+    the English twins of *_ar fields (e.g. possible_answers) are dropped.
+    Field names are unchanged so existing clients keep working.
+    """
+    if isinstance(data, list):
+        return [project_language(item, lang) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    other_suffix = "_ar" if lang == Language.EN else "_en"
+    projected = {}
+    for key, value in data.items():
+        if key.endswith(other_suffix):
+            continue
+        if lang == Language.AR and f"{key}_ar" in data and key not in SHARED_FIELDS:
+            continue
+        projected[key] = project_language(value, lang)
+    return projected
+
+class CatalogPayload:
+    """Serialized catalog response with lazily built precompressed variants"""
+
+    __slots__ = ("version", "body", "_encoded")
+
+    def __init__(self, version: int, body: bytes):
+        self.version = version
+        self.body = body
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        # Compression CPU is paid once per encoding per catalog version
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress_body(self.body, encoding)
+        return self._encoded[encoding]
+
+def get_catalog_version() -> int:
+    return _catalog_version
+
+def set_catalog_version(version: int):
+    """Switch to a new catalog version, dropping all cached payloads"""
+    global _catalog_version
+    if version != _catalog_version:
+        _catalog_version = version
+        _section_payloads.clear()
+        _problem_payloads.clear()
+
+async def refresh_catalog_version(force: bool = False) -> int:
+    """Pick up the stored catalog version, at most once per CATALOG_VERSION_TTL seconds"""
+    global _version_checked_at
+    now = time.monotonic()
+    if force or _version_checked_at is None or now - _version_checked_at >= CATALOG_VERSION_TTL:
+        _version_checked_at = now
+        version = await load_catalog_version()
+        if version != _catalog_version:
+            # Problem id renames are published together with a catalog version bump
+            await load_problem_id_renames()
+        set_catalog_version(version)
+    return _catalog_version
+
+def _build_payload(version: int, content, lang: Optional[Language]) -> CatalogPayload:
+    if lang is not None:
+        content = project_language(content, lang)
+    return CatalogPayload(version, dump_json(content))
+
+async def get_section_payload(section_id: str, lang: Optional[Language] = None) -> Optional[CatalogPayload]:
+    """Get the serialized problem list of a section, None if the section is empty"""
+    await refresh_catalog_version()
+    key = (section_id, lang.value if lang else None)
+    payload = _section_payloads.get(key)
+    if payload is not None and payload.version == _catalog_version:
+        return payload
+
+    version = _catalog_version
+    problems = await get_section_problems(section_id)
+    if not problems:
+        # Unknown sections are not cached so arbitrary ids cannot grow the cache
+        return None
+
+    payload = _build_payload(version, [p.model_dump(mode="json") for p in problems], lang)
+    if version == _catalog_version:
+        _section_payloads[key] = payload
+    return payload
+
+async def get_problem_payload(problem_id: str, lang: Optional[Language] = None) -> Optional[CatalogPayload]:
+    """Get the serialized problem, None if it does not exist"""
+    await refresh_catalog_version()
+    key = (problem_id, lang.value if lang else None)
+    payload = _problem_payloads.get(key)
+    if payload is not None and payload.version == _catalog_version:
+        return payload
+
+    version = _catalog_version
+    problem = await get_problem(problem_id)
+    if not problem:
+        return None
+
+    payload = _build_payload(version, problem.model_dump(mode="json"), lang)
+    if version == _catalog_version:
+        _problem_payloads[key] = payload
+    return payload
+
+def catalog_response(payload: CatalogPayload, accept_encoding: Optional[str]) -> Response:
+    """Build a JSON response, using a precompressed variant when the client accepts one"""
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None or len(payload.body) < MIN_COMPRESS_SIZE:
+        return Response(content=payload.body, media_type="application/json",
+                        headers={"Vary": "Accept-Encoding"})
+
+    return Response(
+        content=payload.encoded(encoding),
+        media_type="application/json",
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+    )
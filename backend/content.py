@@ -0,0 +1,49 @@
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List
+
+from models import Problem, Section
+
+# The curriculum bundle is the single source of truth for sections and problems.
+# It is shared by the server seeder and the migration scripts.
+CONTENT_DIR = Path(__file__).parent / 'content'
+CURRICULUM_PATH = Path(os.environ.get('CURRICULUM_BUNDLE', CONTENT_DIR / 'curriculum.json'))
+
+class CurriculumBundle:
+    """Validated curriculum content loaded from the bundle file"""
+
+    def __init__(self, version: str, sections: List[Section]):
+        self.version = version
+        self.sections = sections
+
+    @property
+    def problems(self) -> List[Problem]:
+        return [problem for section in self.sections for problem in section.problems]
+
+    def section_documents(self) -> List[Dict]:
+        """Section documents as stored in the sections collection (without problems)"""
+        return [
+            section.model_dump(mode="json", exclude={"problems"})
+            for section in self.sections
+        ]
+
+    def problem_documents(self) -> List[Dict]:
+        """Problem documents as stored in the problems collection"""
+        # exclude_unset keeps the stored documents identical to the bundle entries
+        return [problem.model_dump(mode="json", exclude_unset=True) for problem in self.problems]
+
+@lru_cache(maxsize=None)
+def load_curriculum(path: Path = CURRICULUM_PATH) -> CurriculumBundle:
+    """Load and validate the curriculum bundle once per process"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    sections = [Section(**section) for section in data["sections"]]
+    for section in sections:
+        for problem in section.problems:
+            if problem.section_id != section.id:
+                raise ValueError(f"Problem {problem.id} is listed under {section.id} but belongs to {problem.section_id}")
+
+    return CurriculumBundle(data["version"], sections)
@@ -0,0 +1,126 @@
+import hashlib
+import json
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne
+
+from content import CurriculumBundle, load_curriculum
+
+# Single metadata document tracking what was last synced into the catalog
+CATALOG_META_ID = "curriculum"
+
+def content_hash(document: Dict) -> str:
+    """Stable hash of a catalog document (key order independent)"""
+    canonical = json.dumps(document, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def bundle_hash(problem_hashes: Dict[str, str], section_hashes: Dict[str, str]) -> str:
+    combined = {"problems": problem_hashes, "sections": section_hashes}
+    return content_hash(combined)
+
+def _diff_operations(collection_docs: List[Dict], stored: List[Dict], kind: str, report: Dict) -> List:
+    """Build the bulk operations that bring the stored documents in line with the bundle"""
+    operations = []
+    # Hash what is actually stored so manual edits in the database are detected too
+    stored_hashes = {doc["id"]: content_hash(doc) for doc in stored}
+    stored_counts = Counter(doc["id"] for doc in stored)
+    wanted_ids = set()
+
+    for document in collection_docs:
+        doc_id = document["id"]
+        wanted_ids.add(doc_id)
+
+        if stored_counts[doc_id] > 1:
+            # Older seeders could insert a section twice - collapse duplicates
+            operations.append(DeleteMany({"id": doc_id}))
+            operations.append(InsertOne(document))
+            report[f"{kind}_updated"].append(doc_id)
+        elif doc_id not in stored_hashes:
+            operations.append(InsertOne(document))
+            report[f"{kind}_inserted"].append(doc_id)
+        elif stored_hashes[doc_id] != content_hash(document):
+            operations.append(ReplaceOne({"id": doc_id}, document, upsert=True))
+            report[f"{kind}_updated"].append(doc_id)
+
+    for doc_id in stored_counts:
+        if doc_id not in wanted_ids:
+            operations.append(DeleteMany({"id": doc_id}) if stored_counts[doc_id] > 1 else DeleteOne({"id": doc_id}))
+            report[f"{kind}_deleted"].append(doc_id)
+
+    return operations
+
+async def sync_curriculum(db, curriculum: Optional[CurriculumBundle] = None,
+                          force: bool = False, dry_run: bool = False) -> Dict:
+    """
+    Bring the problems and sections collections in line with the curriculum bundle.
+    Only changed documents are written, so the catalog is never empty while syncing.
+    The catalog version is bumped whenever something changed so caches can be invalidated.
+    """
+    curriculum = curriculum or load_curriculum()
+
+    problems = curriculum.problem_documents()
+    sections = curriculum.section_documents()
+    current_hash = bundle_hash(
+        {doc["id"]: content_hash(doc) for doc in problems},
+        {doc["id"]: content_hash(doc) for doc in sections},
+    )
+
+    meta = await db.catalog_meta.find_one({"_id": CATALOG_META_ID}) or {}
+    report = {
+        "bundle_version": curriculum.version,
+        "changed": False,
+        "problems_inserted": [],
+        "problems_updated": [],
+        "problems_deleted": [],
+        "sections_inserted": [],
+        "sections_updated": [],
+        "sections_deleted": [],
+        "catalog_version": meta.get("catalog_version", 0),
+    }
+
+    # Fast path: nothing to compare when the stored catalog came from this exact bundle
+    if not force and meta.get("bundle_hash") == current_hash:
+        return report
+
+    stored_problems = await db.problems.find({}, {"_id": 0}).to_list(None)
+    stored_sections = await db.sections.find({}, {"_id": 0}).to_list(None)
+
+    problem_ops = _diff_operations(problems, stored_problems, "problems", report)
+    section_ops = _diff_operations(sections, stored_sections, "sections", report)
+    report["changed"] = bool(problem_ops or section_ops)
+
+    if dry_run:
+        return report
+
+    if problem_ops:
+        await db.problems.bulk_write(problem_ops, ordered=True)
+    if section_ops:
+        await db.sections.bulk_write(section_ops, ordered=True)
+
+    update = {"$set": {
+        "bundle_version": curriculum.version,
+        "bundle_hash": current_hash,
+        "synced_at": datetime.utcnow(),
+    }}
+    if report["changed"]:
+        update["$inc"] = {"catalog_version": 1}
+
+    meta = await db.catalog_meta.find_one_and_update(
+        {"_id": CATALOG_META_ID}, update, upsert=True, return_document=True
+    )
+    report["catalog_version"] = meta.get("catalog_version", 0)
+    return report
+
+def format_report(report: Dict) -> str:
+    """Human readable summary of a sync report"""
+    if not report["changed"]:
+        return f"Curriculum {report['bundle_version']} already in sync (catalog version {report['catalog_version']})"
+
+    lines = [f"Curriculum {report['bundle_version']} synced (catalog version {report['catalog_version']})"]
+    for key in ("problems_inserted", "problems_updated", "problems_deleted",
+                "sections_inserted", "sections_updated", "sections_deleted"):
+        if report[key]:
+            lines.append(f"  {key.replace('_', ' ')}: {', '.join(report[key])}")
+    return "\n".join(lines)
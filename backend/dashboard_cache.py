@@ -0,0 +1,94 @@
+"""
+Stale-while-revalidate cache of the teacher dashboard rows, per class filter.
+
+A result younger than DASHBOARD_CACHE_TTL_SECONDS is served as is. An older
+one, or one whose class had a progress write since it was computed, is still
+served immediately while a background task recomputes it (one per class
+filter at a time). Only results older than DASHBOARD_CACHE_MAX_STALE_SECONDS
+make the request wait for a fresh computation.
+
+Writes are seen through the dashboard event broker, so with
+EVENTS_CHANNEL=mongo a write on any worker expires the cached class here.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from database import get_all_students_stats
+
+DASHBOARD_CACHE_TTL_SECONDS = float(os.environ.get('DASHBOARD_CACHE_TTL_SECONDS', '5'))
+DASHBOARD_CACHE_MAX_STALE_SECONDS = float(os.environ.get('DASHBOARD_CACHE_MAX_STALE_SECONDS', '60'))
+
+logger = logging.getLogger(__name__)
+
+class DashboardCache:
+    def __init__(self, load: Callable[[Optional[str]], Awaitable[List[Dict]]]):
+        self.load = load
+        self._entries: Dict[Optional[str], Dict] = {}
+        self._refreshes: Dict[Optional[str], asyncio.Task] = {}
+        # class_name -> monotonic time of its last progress write; None is any class
+        self._written: Dict[Optional[str], float] = {}
+        # Bumped by clear(), so computations started before it are not stored
+        self._generation = 0
+
+    def invalidate(self, class_name: str):
+        now = time.monotonic()
+        self._written[class_name] = now
+        self._written[None] = now
+
+    def on_event(self, event: Dict):
+        """Event broker listener"""
+        if event.get("type") == "progress":
+            self.invalidate(event["class_name"])
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+
+    def _fresh(self, class_filter: Optional[str], entry: Dict, now: float) -> bool:
+        return (now - entry["started"] < DASHBOARD_CACHE_TTL_SECONDS
+                and self._written.get(class_filter, 0) < entry["started"])
+
+    async def _compute(self, class_filter: Optional[str]) -> List[Dict]:
+        # A write during the computation leaves the result stale
+        started = time.monotonic()
+        generation = self._generation
+        stats = await self.load(class_filter)
+        if generation != self._generation:
+            # The data was cleared meanwhile; the result may still hold deleted students
+            return stats
+        if stats:
+            self._entries[class_filter] = {"stats": stats, "started": started}
+        else:
+            # Empty results are not cached so arbitrary filters cannot grow the cache
+            self._entries.pop(class_filter, None)
+        return stats
+
+    async def _revalidate(self, class_filter: Optional[str]):
+        try:
+            await self._compute(class_filter)
+        except Exception as e:
+            # The stale entry stays; the next request tries again
+            logger.error(f"Error refreshing dashboard cache for {class_filter!r}: {e}")
+        finally:
+            self._refreshes.pop(class_filter, None)
+
+    async def get(self, class_filter: Optional[str] = None) -> Tuple[List[Dict], float]:
+        """(dashboard rows, age of the rows in seconds)"""
+        if DASHBOARD_CACHE_TTL_SECONDS <= 0:
+            return await self.load(class_filter), 0.0
+
+        now = time.monotonic()
+        entry = self._entries.get(class_filter)
+        if entry is None or now - entry["started"] > DASHBOARD_CACHE_MAX_STALE_SECONDS:
+            stats = await self._compute(class_filter)
+            return stats, 0.0
+
+        if not self._fresh(class_filter, entry, now) and class_filter not in self._refreshes:
+            self._refreshes[class_filter] = asyncio.create_task(self._revalidate(class_filter))
+        return entry["stats"], now - entry["started"]
+
+dashboard_cache = DashboardCache(get_all_students_stats)
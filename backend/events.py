@@ -0,0 +1,170 @@
+"""
+Live dashboard events.
+
+update_progress publishes a small "student changed" event. Events reach the
+open dashboards of this worker directly, and the other workers through a
+capped collection that every worker tails (EVENTS_CHANNEL=mongo); with
+EVENTS_CHANNEL=local (single worker) the collection is not used.
+
+A worker recomputes a student's dashboard row once per event, and only if
+one of its subscribers watches that student's class, then pushes it to those
+subscribers' queues. A subscriber that falls behind gets a "resync" message
+and reloads the full dashboard instead of being sent a growing backlog.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+
+EVENTS_CHANNEL = os.environ.get('EVENTS_CHANNEL', 'mongo')
+EVENTS_COLLECTION = "dashboard_events"
+EVENTS_CAPPED_BYTES = int(os.environ.get('EVENTS_CAPPED_BYTES', str(1024 * 1024)))
+EVENTS_QUEUE_SIZE = int(os.environ.get('EVENTS_QUEUE_SIZE', '100'))
+
+logger = logging.getLogger(__name__)
+
+# Identifies this worker's events in the shared channel
+ORIGIN = uuid.uuid4().hex
+
+class Subscription:
+    def __init__(self, class_filter: Optional[str]):
+        self.class_filter = class_filter
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENTS_QUEUE_SIZE)
+        self.overflowed = False
+
+    def matches(self, class_name: str) -> bool:
+        return self.class_filter is None or self.class_filter == class_name
+
+    def offer(self, message: Dict):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client reloads everything once
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"event": "resync", "data": {}})
+
+    async def next(self, timeout: float) -> Optional[Dict]:
+        """Next message, or None after `timeout` seconds without one"""
+        try:
+            message = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message["event"] == "resync":
+            self.overflowed = False
+        return message
+
+class EventBroker:
+    """In-process pub/sub for dashboard updates with a cross-worker channel"""
+
+    def __init__(self):
+        self.subscriptions: Set[Subscription] = set()
+        self.collection = None
+        self.load_student_row: Optional[Callable[[str], Awaitable[Optional[Dict]]]] = None
+        self._tailer: Optional[asyncio.Task] = None
+        self._deliveries: Set[asyncio.Task] = set()
+        self.listeners: List[Callable[[Dict], None]] = []
+
+    async def start(self, db, load_student_row: Callable[[str], Awaitable[Optional[Dict]]]):
+        self.load_student_row = load_student_row
+        if EVENTS_CHANNEL != "mongo":
+            return
+        try:
+            await db.create_collection(EVENTS_COLLECTION, capped=True, size=EVENTS_CAPPED_BYTES)
+            # A tailable cursor on an empty capped collection dies immediately
+            await db[EVENTS_COLLECTION].insert_one({"type": "created", "origin": ORIGIN, "at": datetime.utcnow()})
+        except CollectionInvalid:
+            pass
+        except Exception as e:
+            # Dashboards on this worker still get its own events
+            logger.error(f"Dashboard event channel unavailable, using local events only: {e}")
+            return
+        self.collection = db[EVENTS_COLLECTION]
+        self._tailer = asyncio.create_task(self._tail())
+
+    async def stop(self):
+        if self._tailer:
+            self._tailer.cancel()
+            self._tailer = None
+
+    def subscribe(self, class_filter: Optional[str] = None) -> Subscription:
+        subscription = Subscription(class_filter)
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscriptions.discard(subscription)
+
+    def add_listener(self, listener: Callable[[Dict], None]):
+        """Call `listener` synchronously with every progress event, local or from other workers"""
+        self.listeners.append(listener)
+
+    async def publish(self, username: str, class_name: str, problem_id: str):
+        """Announce that a student's progress changed; never raises"""
+        event = {"type": "progress", "origin": ORIGIN, "username": username,
+                 "class_name": class_name, "problem_id": problem_id, "at": datetime.utcnow()}
+        self._schedule(event)
+        if self.collection is not None:
+            try:
+                await self.collection.insert_one(event)
+            except Exception as e:
+                logger.error(f"Error publishing dashboard event: {e}")
+
+    def _schedule(self, event: Dict):
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Error in dashboard event listener: {e}")
+        # Delivery reads the student's row; the publishing request does not wait for it
+        if not any(s.matches(event["class_name"]) for s in self.subscriptions):
+            return
+        task = asyncio.create_task(self._deliver(event))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, event: Dict):
+        try:
+            row = await self.load_student_row(event["username"]) if self.load_student_row else None
+        except Exception as e:
+            logger.error(f"Error loading dashboard row for {event['username']}: {e}")
+            return
+        if row is None:
+            return
+        message = {"event": "student", "data": row}
+        for subscription in list(self.subscriptions):
+            if subscription.matches(event["class_name"]):
+                subscription.offer(message)
+
+    async def _tail(self):
+        """Deliver events published by the other workers"""
+        last_id = None
+        while True:
+            try:
+                if last_id is None:
+                    # Start after the newest event; older ones are history
+                    last = await self.collection.find_one({}, sort=[("$natural", -1)])
+                    last_id = last["_id"] if last else None
+                # Only used when the cursor has to be reopened
+                query = {"_id": {"$gt": last_id}} if last_id else {}
+                cursor = self.collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+                async for event in cursor:
+                    last_id = event["_id"]
+                    if event.get("type") == "progress" and event.get("origin") != ORIGIN:
+                        self._schedule(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Dashboard event channel error: {e}")
+            await asyncio.sleep(1)
+
+broker = EventBroker()
@@ -0,0 +1,179 @@
+"""
+Answer grading with a verdict cache and a process pool for expensive checks.
+
+Students of a class tend to submit the same strings for the same problem, so
+verdicts are kept in a bounded LRU keyed by catalog version, problem and the
+raw answer. The cache is emptied when the catalog version changes; the
+expected answer is part of the key as well, so a worker that has not noticed
+a new catalog version yet still grades against the answer it just read.
+
+Cached verdicts and short answers are graded inline. With GRADING_WORKERS > 0
+longer answers (and any CPU-heavy check passed to grader.run) go to a
+process pool instead, so they cannot stall the event loop of the worker, and
+are abandoned after GRADING_TIMEOUT_SECONDS. A timed-out call keeps its pool
+process busy until it finishes; the pool only stops waiting for it.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from models import Problem
+from utils import normalize_answer
+
+VERDICT_CACHE_SIZE = int(os.environ.get('VERDICT_CACHE_SIZE', '10000'))
+GRADING_WORKERS = int(os.environ.get('GRADING_WORKERS', '0'))
+GRADING_TIMEOUT_SECONDS = float(os.environ.get('GRADING_TIMEOUT_SECONDS', '2'))
+GRADING_INLINE_MAX_CHARS = int(os.environ.get('GRADING_INLINE_MAX_CHARS', '200'))
+POOL_START_TIMEOUT_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+class GradingTimeout(Exception):
+    pass
+
+def canonical_answer(problem_type: str, expected: str) -> str:
+    """Normalized expected answer, the same for every submission to the problem"""
+    return normalize_answer(expected, problem_type, expected)
+
+def grade_values(problem_type: str, expected: str, answer: str, canonical: Optional[str] = None) -> Dict:
+    """{"correct": bool, "normalized": normalized answer}; plain arguments so it can run in the pool"""
+    normalized_answer = normalize_answer(answer, problem_type, expected)
+    if canonical is None:
+        canonical = canonical_answer(problem_type, expected)
+    return {"correct": normalized_answer == canonical, "normalized": normalized_answer}
+
+def grade(problem: Problem, answer: str) -> Dict:
+    return grade_values(problem.type, problem.answer, answer)
+
+class VerdictCache:
+    def __init__(self, maxsize: int = VERDICT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = None
+        self._verdicts: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, catalog_version: int, problem: Problem, answer: str) -> Optional[Dict]:
+        if catalog_version != self.version:
+            self._verdicts.clear()
+            self.version = catalog_version
+
+        key = (problem.id, problem.answer, answer)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._verdicts.move_to_end(key)
+        return verdict
+
+    def store(self, catalog_version: int, problem: Problem, answer: str, verdict: Dict):
+        if self.maxsize <= 0 or catalog_version != self.version:
+            return
+        self._verdicts[(problem.id, problem.answer, answer)] = verdict
+        if len(self._verdicts) > self.maxsize:
+            self._verdicts.popitem(last=False)
+            self.evictions += 1
+
+    def grade(self, catalog_version: int, problem: Problem, answer: str) -> Dict:
+        verdict = self.lookup(catalog_version, problem, answer)
+        if verdict is None:
+            verdict = grade(problem, answer)
+            self.store(catalog_version, problem, answer, verdict)
+        return verdict
+
+    def snapshot(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "catalog_version": self.version,
+            "size": len(self._verdicts),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate_pct": round(self.hits / lookups * 100, 1) if lookups else 0,
+        }
+
+verdicts = VerdictCache()
+
+class GradingExecutor:
+    """Inline fast path plus an optional process pool with per-call timeouts"""
+
+    def __init__(self, workers: int = GRADING_WORKERS, timeout: float = GRADING_TIMEOUT_SECONDS):
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.reset()
+
+    def reset(self):
+        self.inline = 0
+        self.offloaded = 0
+        self.timeouts = 0
+
+    async def start(self):
+        if self.workers <= 0 or self._pool is not None:
+            return
+        # spawn rather than fork: the API process runs driver threads
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            # Start every pool process now instead of on the first expensive answers;
+            # spawning imports the grading code, which takes longer than a grading call
+            await asyncio.gather(*(
+                self.run(grade_values, "practice", "0", "0", timeout=POOL_START_TIMEOUT_SECONDS)
+                for _ in range(self.workers)
+            ))
+        except Exception as e:
+            logger.error(f"Grading pool unavailable, grading inline: {e}")
+            self.stop()
+        self.reset()
+
+    def stop(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """fn(*args) in the pool, or inline without one; fn and args must be picklable"""
+        if self._pool is None:
+            self.inline += 1
+            return fn(*args)
+        self.offloaded += 1
+        future = asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        try:
+            return await asyncio.wait_for(future, timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise GradingTimeout(f"{getattr(fn, '__name__', fn)} did not finish within {timeout or self.timeout}s")
+
+    async def grade(self, catalog_version: int, problem: Problem, answer: str) -> Dict:
+        verdict = verdicts.lookup(catalog_version, problem, answer)
+        if verdict is not None:
+            return verdict
+        if len(answer) <= GRADING_INLINE_MAX_CHARS:
+            self.inline += 1
+            verdict = grade(problem, answer)
+        else:
+            verdict = await self.run(grade_values, problem.type.value, problem.answer, answer)
+        verdicts.store(catalog_version, problem, answer, verdict)
+        return verdict
+
+    def snapshot(self) -> Dict:
+        return {
+            "workers": self.workers if self._pool is not None else 0,
+            "timeout_seconds": self.timeout,
+            "inline_max_chars": GRADING_INLINE_MAX_CHARS,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "timeouts": self.timeouts,
+        }
+
+grader = GradingExecutor()
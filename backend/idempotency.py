@@ -0,0 +1,195 @@
+"""
+Idempotency-Key support for write endpoints.
+
+A client that retries a request with the same Idempotency-Key header gets the
+stored response of the first request instead of having it run again, so a
+flaky network cannot count an answer twice. Keys are scoped per endpoint and
+student and kept in the idempotency_keys collection:
+
+    {"_id": "attempt:ali:<key>", "fingerprint": <sha256 of the request body>,
+     "status": "pending" | "done", "response": {...}, "created_at": <datetime>}
+
+A TTL index drops them after IDEMPOTENCY_TTL_HOURS. Completed responses are
+also kept in a small in-memory cache, so most retries never reach MongoDB.
+
+The first request claims the key by inserting a pending document. A retry
+that arrives while it is still running waits for it (on this worker directly,
+on other workers by polling), and a claim left behind by a crashed worker is
+taken over after IDEMPOTENCY_PENDING_SECONDS. A failed request releases its
+claim, so the retry runs normally. Reusing a key for a different request body
+is rejected with 422.
+
+Once the request has run, storing its response is retried: a claim left
+pending would be taken over and the request applied twice.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pymongo.errors import DuplicateKeyError
+
+IDEMPOTENCY_TTL_HOURS = int(os.environ.get('IDEMPOTENCY_TTL_HOURS', '24'))
+IDEMPOTENCY_CACHE_SIZE = int(os.environ.get('IDEMPOTENCY_CACHE_SIZE', '10000'))
+IDEMPOTENCY_PENDING_SECONDS = float(os.environ.get('IDEMPOTENCY_PENDING_SECONDS', '30'))
+MAX_KEY_LENGTH = 255
+# How often a retry checks whether the first request finished on another worker
+POLL_SECONDS = 0.1
+# Pauses between tries of storing a response
+COMPLETE_RETRY_SECONDS = (0.1, 0.5, 2.0)
+
+logger = logging.getLogger(__name__)
+
+def fingerprint(request: Any) -> str:
+    body = json.dumps(jsonable_encoder(request), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+def replay(response: Dict) -> JSONResponse:
+    return JSONResponse(content=response, headers={"Idempotent-Replayed": "true"})
+
+class IdempotencyKeys:
+    def __init__(self, collection):
+        self.collection = collection
+        # _id -> (fingerprint, response, expires at (monotonic))
+        self._responses: "OrderedDict[str, tuple]" = OrderedDict()
+        self._running: Dict[str, asyncio.Future] = {}
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("created_at", expireAfterSeconds=IDEMPOTENCY_TTL_HOURS * 3600)
+
+    async def clear(self):
+        await self.collection.delete_many({})
+        self._responses.clear()
+
+    def _remember(self, key_id: str, request_fingerprint: str, response: Dict):
+        if IDEMPOTENCY_CACHE_SIZE <= 0:
+            return
+        self._responses[key_id] = (request_fingerprint, response, time.monotonic() + IDEMPOTENCY_TTL_HOURS * 3600)
+        self._responses.move_to_end(key_id)
+        if len(self._responses) > IDEMPOTENCY_CACHE_SIZE:
+            self._responses.popitem(last=False)
+
+    def _cached(self, key_id: str) -> Optional[tuple]:
+        entry = self._responses.get(key_id)
+        if entry is None:
+            return None
+        if entry[2] < time.monotonic():
+            del self._responses[key_id]
+            return None
+        return entry
+
+    @staticmethod
+    def _check(stored_fingerprint: str, request_fingerprint: str):
+        if stored_fingerprint != request_fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+
+    async def _claim(self, key_id: str, request_fingerprint: str) -> Optional[Dict]:
+        """None once this request owns the key, else the stored response of the first request"""
+        deadline = time.monotonic() + IDEMPOTENCY_PENDING_SECONDS
+        while True:
+            now = datetime.utcnow()
+            try:
+                await self.collection.insert_one({
+                    "_id": key_id, "fingerprint": request_fingerprint, "status": "pending", "created_at": now
+                })
+                return None
+            except DuplicateKeyError:
+                pass
+
+            stored = await self.collection.find_one({"_id": key_id})
+            if stored is None:
+                # Released by a failed first request (or expired) in the meantime
+                continue
+            self._check(stored["fingerprint"], request_fingerprint)
+            if stored["status"] == "done":
+                return stored["response"]
+
+            if stored["created_at"] < now - timedelta(seconds=IDEMPOTENCY_PENDING_SECONDS):
+                # The worker that claimed the key never finished - take it over
+                result = await self.collection.replace_one(
+                    {"_id": key_id, "status": "pending", "created_at": stored["created_at"]},
+                    {"fingerprint": request_fingerprint, "status": "pending", "created_at": now},
+                )
+                if result.modified_count:
+                    return None
+            elif time.monotonic() >= deadline:
+                raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still being processed")
+            await asyncio.sleep(POLL_SECONDS)
+
+    async def _complete(self, key_id: str, response: Dict):
+        """Store the response of a request that has run, retrying transient errors"""
+        for delay in COMPLETE_RETRY_SECONDS + (None,):
+            try:
+                await self.collection.update_one(
+                    {"_id": key_id}, {"$set": {"status": "done", "response": response}}
+                )
+                return
+            except Exception as e:
+                if delay is None:
+                    # The request was applied, so it is answered anyway; retries reaching
+                    # this worker are replayed from memory
+                    logger.error(f"Could not store the response of idempotency key {key_id}: {e}")
+                    return
+                await asyncio.sleep(delay)
+
+    async def run(self, scope: str, key: Optional[str], request: Any, handler: Callable[[], Awaitable[Any]]):
+        """handler() once per (scope, key); retries get the first response back"""
+        if not key:
+            return await handler()
+        if len(key) > MAX_KEY_LENGTH:
+            raise HTTPException(status_code=400, detail=f"Idempotency-Key is longer than {MAX_KEY_LENGTH} characters")
+
+        key_id = f"{scope}:{key}"
+        request_fingerprint = fingerprint(request)
+
+        cached = self._cached(key_id)
+        if cached is not None:
+            self._check(cached[0], request_fingerprint)
+            return replay(cached[1])
+
+        running = self._running.get(key_id)
+        if running is not None:
+            try:
+                stored_fingerprint, response = await asyncio.shield(running)
+            except Exception:
+                # The first request failed and released the key; this one runs instead
+                return await self.run(scope, key, request, handler)
+            self._check(stored_fingerprint, request_fingerprint)
+            return replay(response)
+
+        future = asyncio.get_running_loop().create_future()
+        self._running[key_id] = future
+        try:
+            stored = await self._claim(key_id, request_fingerprint)
+            if stored is not None:
+                self._remember(key_id, request_fingerprint, stored)
+                future.set_result((request_fingerprint, stored))
+                return replay(stored)
+
+            try:
+                result = await handler()
+            except BaseException:
+                await self.collection.delete_one({"_id": key_id, "status": "pending"})
+                raise
+            response = jsonable_encoder(result)
+            await self._complete(key_id, response)
+            self._remember(key_id, request_fingerprint, response)
+            future.set_result((request_fingerprint, response))
+            return result
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e if isinstance(e, Exception) else RuntimeError("The first request was cancelled"))
+                # Retrieved here so a failure nobody else waited for is not logged as unhandled
+                future.exception()
+            raise
+        finally:
+            del self._running[key_id]
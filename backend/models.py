@@ -3,6 +3,8 @@ from typing import List, Optional, Dict
 from datetime import datetime
 from enum import Enum
 
+from utils import MAX_ANSWER_LENGTH
+
 class ProblemType(str, Enum):
     PREPARATION = "preparation"
     EXPLANATION = "explanation"
@@ -11,6 +13,14 @@ class ProblemType(str, Enum):
     ASSESSMENT = "assessment"
     EXAMPREP = "examprep"
 
+class Language(str, Enum):
+    EN = "en"
+    AR = "ar"
+
+class DashboardFormat(str, Enum):
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+
 class Student(BaseModel):
     username: str = Field(..., min_length=1, max_length=50)
     class_name: str = Field(default="GR9-A", pattern="^GR9-[A-D]$")
@@ -32,6 +42,8 @@ class Progress(BaseModel):
     attempts: int = Field(default=0, ge=0)
     hints_used: int = Field(default=0, ge=0)
     last_attempt: Optional[datetime] = None
+    # Student progress revision of the write that last changed the row (see /progress?since=)
+    revision: int = Field(default=0, ge=0)
 
 class ProgressUpdate(BaseModel):
     completed: bool
@@ -41,7 +53,7 @@ class ProgressUpdate(BaseModel):
 
 class ProblemAttempt(BaseModel):
     problem_id: str
-    answer: str
+    answer: str = Field(max_length=MAX_ANSWER_LENGTH)
     hints_used: int = Field(default=0, ge=0)
 
 class PracticeExample(BaseModel):
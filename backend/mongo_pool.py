@@ -0,0 +1,185 @@
+"""
+MongoDB client settings shared by the API and the maintenance scripts,
+plus connection pool metrics collected through pymongo's monitoring API.
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+from pymongo import monitoring
+
+# Pool sizing is per client and per worker process: with N uvicorn workers the
+# deployment opens up to N * MONGO_MAX_POOL_SIZE connections to each server
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '0'))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '0'))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '30000'))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '20000'))
+MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '0'))
+
+# Recent checkout waits kept for percentiles
+WAIT_SAMPLES = int(os.environ.get('MONGO_POOL_WAIT_SAMPLES', '2048'))
+
+def client_options(client_name: str = "default", **overrides) -> Dict:
+    """Keyword arguments for AsyncIOMotorClient; 0 leaves a timeout/limit at the driver default
+
+    Pool metrics are kept per client_name, so clients that connect to the same
+    servers (the API and analytics clients) are reported separately.
+    """
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+    }
+    if MONGO_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = MONGO_MAX_IDLE_TIME_MS
+    if MONGO_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if MONGO_SOCKET_TIMEOUT_MS:
+        options["socketTimeoutMS"] = MONGO_SOCKET_TIMEOUT_MS
+    options.update(overrides)
+    metrics = pool_metrics.setdefault(client_name, PoolMetrics())
+    options["event_listeners"] = list(options.get("event_listeners", [])) + [metrics]
+    return options
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+# Reset with the measurement window; open and in_use follow the connections
+COUNTERS = ("created", "closed", "checkouts", "checkout_failures", "cleared")
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Checkout wait times and connection counts of one client, per server address.
+
+    The driver calls listeners from its own threads, hence the lock.
+    """
+
+    def __init__(self, samples: int = WAIT_SAMPLES):
+        self._lock = threading.Lock()
+        self._samples = samples
+        self._pools: Dict[str, Dict] = {}
+
+    def reset(self):
+        """Start a new window of counters and waits; the open/in_use gauges are kept"""
+        with self._lock:
+            for pool in self._pools.values():
+                for counter in COUNTERS:
+                    pool[counter] = 0
+                pool["max_in_use"] = pool["in_use"]
+                pool["wait_total_ms"] = 0.0
+                pool["wait_max_ms"] = 0.0
+                pool["waits"].clear()
+
+    def _pool(self, address) -> Dict:
+        key = "%s:%s" % address
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = {
+                "open": 0, "in_use": 0, "max_in_use": 0, "created": 0, "closed": 0,
+                "checkouts": 0, "checkout_failures": 0, "cleared": 0,
+                "wait_total_ms": 0.0, "wait_max_ms": 0.0,
+                "waits": deque(maxlen=self._samples),
+            }
+        return pool
+
+    def _record_wait(self, pool: Dict, duration: Optional[float]):
+        if duration is None:
+            return
+        wait_ms = duration * 1000
+        pool["wait_total_ms"] += wait_ms
+        pool["wait_max_ms"] = max(pool["wait_max_ms"], wait_ms)
+        pool["waits"].append(wait_ms)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["checkouts"] += 1
+            pool["in_use"] += 1
+            pool["max_in_use"] = max(pool["max_in_use"], pool["in_use"])
+            self._record_wait(pool, event.duration)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["checkout_failures"] += 1
+            self._record_wait(pool, event.duration)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["in_use"] = max(pool["in_use"] - 1, 0)
+
+    def connection_created(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["created"] += 1
+            pool["open"] += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["closed"] += 1
+            pool["open"] = max(pool["open"] - 1, 0)
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._pool(event.address)["cleared"] += 1
+
+    # Remaining events carry nothing we report
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self) -> Dict:
+        """Per-address counters and checkout wait percentiles in milliseconds"""
+        with self._lock:
+            result = {}
+            for address, pool in self._pools.items():
+                waits = list(pool["waits"])
+                stats = {k: v for k, v in pool.items() if k != "waits"}
+                stats["wait_total_ms"] = round(stats["wait_total_ms"], 3)
+                stats["wait_max_ms"] = round(stats["wait_max_ms"], 3)
+                stats["wait_avg_ms"] = round(pool["wait_total_ms"] / pool["checkouts"], 3) if pool["checkouts"] else 0
+                stats["wait_p50_ms"] = round(_percentile(waits, 0.50), 3) if waits else 0
+                stats["wait_p95_ms"] = round(_percentile(waits, 0.95), 3) if waits else 0
+                stats["wait_p99_ms"] = round(_percentile(waits, 0.99), 3) if waits else 0
+                result[address] = stats
+            return result
+
+# client name -> metrics of that client's pools
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+def pool_stats(reset: bool = False) -> Dict:
+    """{client name: {address: stats}}; reset=True starts a new window after the snapshot"""
+    stats = {}
+    for name, metrics in pool_metrics.items():
+        stats[name] = metrics.snapshot()
+        if reset:
+            metrics.reset()
+    return stats
+
+async def prewarm(client, connections: int = MONGO_MIN_POOL_SIZE):
+    """Open `connections` pooled connections now instead of on the first requests.
+
+    Concurrent pings each need their own connection, so the pool grows to the
+    requested size; the driver keeps it at minPoolSize afterwards.
+    """
+    if connections > 0:
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(connections)))
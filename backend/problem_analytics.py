@@ -0,0 +1,150 @@
+"""
+Per-problem difficulty analytics for teachers.
+
+Progress rows are grouped by problem and class in MongoDB (read through the
+analytics client); only the per-group value lists come back, and percentiles
+are computed from those. Results are cached per catalog version, filter and
+time bucket, so a class full of teachers refreshing the page costs one
+aggregation per bucket: concurrent misses share one aggregation through
+@single_flight. Only the current bucket is kept, at most
+PROBLEM_ANALYTICS_CACHE_SIZE filter combinations of it, and filters that match
+nothing are not cached.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from catalog import refresh_catalog_version
+from database import analytics_progress_store
+from singleflight import single_flight
+
+ANALYTICS_BUCKET_SECONDS = int(os.environ.get('PROBLEM_ANALYTICS_BUCKET_SECONDS', '300'))
+ANALYTICS_CACHE_SIZE = int(os.environ.get('PROBLEM_ANALYTICS_CACHE_SIZE', '256'))
+PERCENTILES = (25, 50, 75, 90)
+
+# (catalog version, bucket, class_filter, section_id) -> response, least recently used first
+_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Linear-interpolated percentile of an already sorted list"""
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def distribution(values: List[Optional[float]]) -> Dict:
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return {"count": 0}
+    result = {"count": len(ordered), "mean": round(sum(ordered) / len(ordered), 2)}
+    for p in PERCENTILES:
+        result[f"p{p}"] = round(percentile(ordered, p), 2)
+    result["max"] = ordered[-1]
+    return result
+
+def analytics_pipeline(class_filter: Optional[str] = None, section_id: Optional[str] = None) -> List[Dict]:
+    match = {"section_id": section_id} if section_id else {}
+    pipeline = [{"$match": match}] if match else []
+    pipeline += [
+        {"$lookup": {
+            "from": "students",
+            "localField": "student_username",
+            "foreignField": "username",
+            "as": "student",
+        }},
+        {"$set": {"class_name": {"$ifNull": [{"$arrayElemAt": ["$student.class_name", 0]}, "GR9-A"]}}},
+    ]
+    if class_filter:
+        pipeline.append({"$match": {"class_name": class_filter}})
+    pipeline += [
+        {"$group": {
+            "_id": {"problem_id": "$problem_id", "class_name": "$class_name"},
+            "section_id": {"$first": "$section_id"},
+            "students": {"$sum": 1},
+            "completed": {"$sum": {"$cond": ["$completed", 1, 0]}},
+            "attempts": {"$push": "$attempts"},
+            "hints": {"$push": "$hints_used"},
+            # Attempts and time until the problem was solved, only for solved rows
+            "attempts_to_solve": {"$push": {"$cond": ["$completed", "$attempts", None]}},
+            "solve_seconds": {"$push": {"$cond": [
+                {"$and": ["$completed", "$completed_at", "$first_attempt"]},
+                {"$divide": [{"$subtract": ["$completed_at", "$first_attempt"]}, 1000]},
+                None,
+            ]}},
+        }},
+    ]
+    return pipeline
+
+def _summarize(group: Dict) -> Dict:
+    return {
+        "students": group["students"],
+        "completed": group["completed"],
+        "completion_rate": round(group["completed"] / group["students"] * 100, 1) if group["students"] else 0,
+        "attempts": distribution(group["attempts"]),
+        "attempts_to_solve": distribution(group["attempts_to_solve"]),
+        "hints_used": distribution(group["hints"]),
+        "solve_seconds": distribution(group["solve_seconds"]),
+    }
+
+async def compute_problem_analytics(class_filter: Optional[str] = None, section_id: Optional[str] = None) -> List[Dict]:
+    groups = await analytics_progress_store.aggregate(
+        analytics_pipeline(class_filter, section_id), allowDiskUse=True
+    ).to_list(None)
+
+    problems: Dict[str, Dict] = {}
+    for group in groups:
+        problem_id = group["_id"]["problem_id"]
+        problem = problems.setdefault(problem_id, {
+            "problem_id": problem_id,
+            "section_id": group["section_id"],
+            "classes": {},
+            "_all": {key: [] if isinstance(group[key], list) else 0
+                     for key in ("students", "completed", "attempts", "hints", "attempts_to_solve", "solve_seconds")},
+        })
+        problem["classes"][group["_id"]["class_name"]] = _summarize(group)
+        for key, value in problem["_all"].items():
+            problem["_all"][key] = value + group[key]
+
+    result = []
+    for problem in problems.values():
+        problem["overall"] = _summarize(problem.pop("_all"))
+        result.append(problem)
+    # Hardest first: lowest completion rate, then most attempts to solve
+    result.sort(key=lambda p: (p["overall"]["completion_rate"], -p["overall"]["attempts_to_solve"].get("mean", 0)))
+    return result
+
+@single_flight
+async def bucket_problem_analytics(version: int, bucket: int, class_filter: Optional[str],
+                                   section_id: Optional[str]) -> Dict:
+    return {
+        "catalog_version": version,
+        "bucket_start": datetime.utcfromtimestamp(bucket * ANALYTICS_BUCKET_SECONDS),
+        "bucket_seconds": ANALYTICS_BUCKET_SECONDS,
+        "generated_at": datetime.utcnow(),
+        "class_filter": class_filter,
+        "section_id": section_id,
+        "problems": await compute_problem_analytics(class_filter, section_id),
+    }
+
+async def get_problem_analytics(class_filter: Optional[str] = None, section_id: Optional[str] = None) -> Dict:
+    """Cached per catalog version, filters and ANALYTICS_BUCKET_SECONDS time bucket"""
+    version = await refresh_catalog_version()
+    bucket = int(time.time() // ANALYTICS_BUCKET_SECONDS)
+    key = (version, bucket, class_filter, section_id)
+    result = _cache.get(key)
+    if result is not None:
+        _cache.move_to_end(key)
+        return result
+
+    result = await bucket_problem_analytics(*key)
+    # Entries from older buckets or catalog versions are never read again
+    for stale in [k for k in _cache if k[:2] != (version, bucket)]:
+        del _cache[stale]
+    if result["problems"]:
+        _cache[key] = result
+        while len(_cache) > ANALYTICS_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
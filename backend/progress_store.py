@@ -0,0 +1,209 @@
+"""
+Storage layouts for student progress.
+
+PROGRESS_LAYOUT=rows (default) keeps one document per student and problem in
+the progress collection. PROGRESS_LAYOUT=document keeps one document per
+student in progress_by_student:
+
+    {"_id": "<username>",
+     "progress": {"prep1": {"section_id": "section1", "completed": true, "score": 100,
+                            "attempts": 1, "hints_used": 0, "last_attempt": ..., ...},
+                  ...},
+     "updated_at": ...}
+
+so a student's progress is one indexed read and a write is a targeted $set on
+progress.<problem_id>.*. Both layouts hand out the same row dicts.
+
+The document layout reads through to the rows of students that have not been
+migrated yet and migrates a student on their first write, so it can be
+switched on before migrate_progress_layout.py has finished. The rows are left
+in place, which keeps switching back possible.
+"""
+
+import os
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+PROGRESS_LAYOUT = os.environ.get('PROGRESS_LAYOUT', 'rows')
+ROWS_COLLECTION = "progress"
+DOCUMENTS_COLLECTION = "progress_by_student"
+
+# Row fields that are part of the key, not of a problem entry
+KEY_FIELDS = ("_id", "student_username", "problem_id")
+
+def rows_from_document(document: Dict) -> List[Dict]:
+    username = document["_id"]
+    return [
+        {**entry, "student_username": username, "problem_id": problem_id}
+        for problem_id, entry in document.get("progress", {}).items()
+    ]
+
+def document_from_rows(username: str, rows: List[Dict]) -> Dict:
+    return {
+        "_id": username,
+        "progress": {
+            row["problem_id"]: {k: v for k, v in row.items() if k not in KEY_FIELDS}
+            for row in rows
+        },
+        "updated_at": datetime.utcnow(),
+    }
+
+class RowLayout:
+    """One progress document per student and problem"""
+
+    name = "rows"
+
+    def __init__(self, db):
+        self.db = db
+        self.rows = db[ROWS_COLLECTION]
+
+    async def read(self, username: str, problem_ids: Optional[List[str]] = None) -> List[Dict]:
+        query = {"student_username": username}
+        if problem_ids is not None:
+            query["problem_id"] = {"$in": problem_ids}
+        return await self.rows.find(query, {"_id": 0}).to_list(None)
+
+    async def read_since(self, username: str, revision: int) -> List[Dict]:
+        """Rows written after the student's progress revision `revision`"""
+        return await self.rows.find(
+            {"student_username": username, "revision": {"$gt": revision}}, {"_id": 0}
+        ).to_list(None)
+
+    async def write(self, username: str, problem_id: str, update_data: Dict) -> Optional[Dict]:
+        """Upsert one problem's progress, returning the previous row (None if new)"""
+        return await self.rows.find_one_and_update(
+            {"student_username": username, "problem_id": problem_id},
+            {"$set": update_data, "$setOnInsert": {"first_attempt": update_data["last_attempt"]}},
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+
+    async def mark_completed(self, username: str, problem_id: str, at: datetime):
+        """Set completed_at unless it is already set"""
+        await self.rows.update_one(
+            {"student_username": username, "problem_id": problem_id, "completed_at": None},
+            {"$set": {"completed_at": at}}
+        )
+
+    async def iter_rows(self) -> AsyncIterator[Dict]:
+        async for row in self.rows.find({}, {"_id": 0}):
+            yield row
+
+    def aggregate(self, pipeline: List[Dict], usernames: Optional[Dict] = None, **kwargs):
+        """Run an aggregation whose input is progress rows
+
+        `usernames` is a query condition on the student username (e.g. a shard
+        range), applied before the rows are built so it can use the indexes.
+        """
+        match = [{"$match": {"student_username": usernames}}] if usernames else []
+        return self.rows.aggregate(match + pipeline, **kwargs)
+
+    async def count(self) -> Dict:
+        return {"rows": await self.rows.count_documents({})}
+
+    async def delete_all(self) -> int:
+        return (await self.rows.delete_many({})).deleted_count
+
+class DocumentLayout(RowLayout):
+    """One progress document per student, with read-through to unmigrated rows"""
+
+    name = "document"
+
+    def __init__(self, db):
+        super().__init__(db)
+        self.documents = db[DOCUMENTS_COLLECTION]
+
+    async def read(self, username: str, problem_ids: Optional[List[str]] = None) -> List[Dict]:
+        projection = {f"progress.{p}": 1 for p in problem_ids} if problem_ids is not None else None
+        document = await self.documents.find_one({"_id": username}, projection)
+        if document is None:
+            return await super().read(username, problem_ids)
+        return rows_from_document(document)
+
+    async def read_since(self, username: str, revision: int) -> List[Dict]:
+        # One document either way; entries are filtered here
+        return [row for row in await self.read(username) if row.get("revision", 0) > revision]
+
+    async def migrate(self, username: str):
+        """Copy a student's rows into their document unless it already exists"""
+        rows = await super().read(username)
+        document = document_from_rows(username, rows)
+        try:
+            await self.documents.update_one(
+                {"_id": username}, {"$setOnInsert": {k: v for k, v in document.items() if k != "_id"}}, upsert=True
+            )
+        except DuplicateKeyError:
+            # A concurrent request migrated the student first
+            pass
+
+    async def write(self, username: str, problem_id: str, update_data: Dict) -> Optional[Dict]:
+        entry = {k: v for k, v in update_data.items() if k not in KEY_FIELDS}
+        prefix = f"progress.{problem_id}"
+        update = {
+            "$set": {**{f"{prefix}.{k}": v for k, v in entry.items()}, "updated_at": update_data["last_attempt"]},
+            # $min on a missing field sets it, so this only records the first attempt
+            "$min": {f"{prefix}.first_attempt": update_data["last_attempt"]},
+        }
+        for _ in range(2):
+            before = await self.documents.find_one_and_update(
+                {"_id": username}, update, projection={prefix: 1}, return_document=ReturnDocument.BEFORE
+            )
+            if before is not None:
+                previous = before.get("progress", {}).get(problem_id)
+                return {**previous, "student_username": username, "problem_id": problem_id} if previous else None
+            # First write since the layout switch - bring the student's rows over, then retry
+            await self.migrate(username)
+        raise RuntimeError(f"Could not migrate progress of {username}")
+
+    async def mark_completed(self, username: str, problem_id: str, at: datetime):
+        prefix = f"progress.{problem_id}"
+        await self.documents.update_one(
+            {"_id": username, f"{prefix}.completed_at": None}, {"$set": {f"{prefix}.completed_at": at}}
+        )
+
+    async def iter_rows(self) -> AsyncIterator[Dict]:
+        migrated = set()
+        async for document in self.documents.find({}):
+            migrated.add(document["_id"])
+            for row in rows_from_document(document):
+                yield row
+        async for row in super().iter_rows():
+            if row["student_username"] not in migrated:
+                yield row
+
+    def aggregate(self, pipeline: List[Dict], usernames: Optional[Dict] = None, **kwargs):
+        documents_match = [{"$match": {"_id": usernames}}] if usernames else []
+        rows_match = [{"$match": {"student_username": usernames}}] if usernames else []
+        as_rows = documents_match + [
+            {"$project": {"entries": {"$objectToArray": "$progress"}}},
+            {"$unwind": "$entries"},
+            {"$replaceRoot": {"newRoot": {"$mergeObjects": [
+                "$entries.v", {"student_username": "$_id", "problem_id": "$entries.k"},
+            ]}}},
+            # Rows of students without a document yet (MongoDB 4.4+)
+            {"$unionWith": {"coll": ROWS_COLLECTION, "pipeline": rows_match + [
+                {"$lookup": {"from": DOCUMENTS_COLLECTION, "localField": "student_username",
+                             "foreignField": "_id", "as": "document"}},
+                {"$match": {"document": {"$size": 0}}},
+                {"$project": {"document": 0, "_id": 0}},
+            ]}},
+        ]
+        return self.documents.aggregate(as_rows + pipeline, **kwargs)
+
+    async def count(self) -> Dict:
+        return {**await super().count(), "documents": await self.documents.count_documents({})}
+
+    async def delete_all(self) -> int:
+        await self.documents.delete_many({})
+        return await super().delete_all()
+
+LAYOUTS = {"rows": RowLayout, "document": DocumentLayout}
+
+def progress_layout(db, name: str = PROGRESS_LAYOUT) -> RowLayout:
+    if name not in LAYOUTS:
+        raise ValueError(f"Unknown PROGRESS_LAYOUT {name!r}, expected one of {sorted(LAYOUTS)}")
+    return LAYOUTS[name](db)
@@ -0,0 +1,92 @@
+"""
+Points and badges, maintained on the student document.
+
+Both only depend on the progress of one section, so a write that changes a
+problem's completion or score recomputes that section from its few progress
+rows, and MongoDB re-adds total_points from section_points in the same update:
+
+    section_points: {"section1": 42, ...}     weighted points per section
+    section_badges: {"section1": ["first_steps", ...], ...}
+    total_points:   sum of section_points
+    badges:         section1 badges (what the dashboard shows)
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from content import load_curriculum
+from utils import calculate_badges, calculate_total_points
+
+# Badges shown on the student dashboard come from this section
+BADGES_SECTION = "section1"
+
+@lru_cache(maxsize=1)
+def _catalog() -> Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, Dict]]:
+    curriculum = load_curriculum()
+    section_of = {p.id: section.id for section in curriculum.sections for p in section.problems}
+    problem_ids = {section.id: [p.id for p in section.problems] for section in curriculum.sections}
+    weights = {p.id: {"weight": p.weight} for p in curriculum.problems}
+    return section_of, problem_ids, weights
+
+def section_of(problem_id: str) -> Optional[str]:
+    return _catalog()[0].get(problem_id)
+
+def section_problem_ids(section_id: str) -> List[str]:
+    return _catalog()[1].get(section_id, [])
+
+def affects_rewards(before: Optional[Dict], after: Dict) -> bool:
+    before = before or {}
+    return (bool(before.get("completed")) != bool(after.get("completed"))
+            or before.get("score", 0) != after.get("score", 0))
+
+def section_rewards(section_id: str, rows: List[Dict]) -> Tuple[int, List[str]]:
+    """(points, badges) of one section from its progress rows"""
+    progress = {
+        problem_id: {"completed": False, "score": 0, "attempts": 0}
+        for problem_id in section_problem_ids(section_id)
+    }
+    for row in rows:
+        progress[row["problem_id"]] = {
+            "completed": row.get("completed", False),
+            "score": row.get("score", 0),
+            "attempts": row.get("attempts", 0),
+        }
+    return calculate_total_points(progress, _catalog()[2]), calculate_badges(progress, section_id)
+
+def student_rewards(rows: List[Dict]) -> Dict:
+    """Full $set document for a student, from all of their progress rows"""
+    by_section: Dict[str, List[Dict]] = {section_id: [] for section_id in _catalog()[1]}
+    for row in rows:
+        section_id = section_of(row["problem_id"])
+        if section_id:
+            by_section[section_id].append(row)
+
+    section_points, section_badges = {}, {}
+    for section_id, section_rows in by_section.items():
+        section_points[section_id], section_badges[section_id] = section_rewards(section_id, section_rows)
+    return {
+        "section_points": section_points,
+        "section_badges": section_badges,
+        "total_points": sum(section_points.values()),
+        "badges": section_badges.get(BADGES_SECTION, []),
+    }
+
+def rewards_update(section_id: str, rows: List[Dict]) -> List[Dict]:
+    """Student update pipeline for one section; `rows` is the section's progress after the write
+
+    total_points is summed from section_points by the server rather than moved
+    by a difference, so concurrent writes to a section cannot leave it off.
+    """
+    points, badges = section_rewards(section_id, rows)
+    section = {
+        "section_points": {"$mergeObjects": ["$section_points", {section_id: points}]},
+        "section_badges": {"$mergeObjects": ["$section_badges", {section_id: {"$literal": badges}}]},
+    }
+    if section_id == BADGES_SECTION:
+        section["badges"] = {"$literal": badges}
+    return [
+        {"$set": section},
+        {"$set": {"total_points": {"$sum": {"$map": {
+            "input": {"$objectToArray": "$section_points"}, "in": "$$this.v",
+        }}}}},
+    ]
@@ -0,0 +1,154 @@
+"""
+Per-class rollups for the teacher views.
+
+One document per class in the class_rollups collection, kept up to date with
+$inc deltas computed from each progress row's state before and after a write:
+
+    {
+        "_id": "GR9-A",
+        "students_count": 28,
+        "totals": {"completed": 240, "score_sum": 20150, "attempts": 610, "hints_used": 95,
+                   "score_histogram": {"0": 3, ..., "90": 120}},
+        "sections": {"section1": {<same counters>}, ...},
+        "students": {"<escaped username>": {"username": "...", <same counters without histogram>}},
+        "updated_at": ...
+    }
+
+Scores count once a problem is completed; the histogram buckets completed
+scores by tens (90 holds 90-100).
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from content import load_curriculum
+
+TOP_STUDENTS = 5
+
+def student_key(username: str) -> str:
+    """Usernames are used as field names, so '.' and a leading '$' are escaped"""
+    key = username.replace(".", "．")
+    return "＄" + key[1:] if key.startswith("$") else key
+
+def score_bucket(score: int) -> str:
+    return str(min(max(score, 0) // 10, 9) * 10)
+
+def rollup_increments(username: str, before: Optional[Dict], after: Optional[Dict]) -> Dict:
+    """$inc document moving a class rollup from `before` to `after` for one progress row"""
+    increments: Dict[str, int] = {}
+
+    def add(path: str, delta: int):
+        increments[path] = increments.get(path, 0) + delta
+
+    for row, sign in ((before, -1), (after, 1)):
+        if not row:
+            continue
+        completed = bool(row.get("completed", False))
+        values = {
+            "completed": int(completed),
+            "score_sum": row.get("score", 0) if completed else 0,
+            "attempts": row.get("attempts", 0),
+            "hints_used": row.get("hints_used", 0),
+        }
+        for prefix in ("totals", f"sections.{row.get('section_id', '')}", f"students.{student_key(username)}"):
+            for counter, value in values.items():
+                add(f"{prefix}.{counter}", sign * value)
+            if completed and not prefix.startswith("students."):
+                add(f"{prefix}.score_histogram.{score_bucket(values['score_sum'])}", sign)
+
+    return {path: delta for path, delta in increments.items() if delta}
+
+async def apply_progress_change(collection, class_name: str, username: str,
+                                before: Optional[Dict], after: Dict):
+    increments = rollup_increments(username, before, after)
+    if not increments:
+        return
+    await collection.update_one(
+        {"_id": class_name},
+        {"$inc": increments,
+         "$set": {f"students.{student_key(username)}.username": username, "updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+
+async def add_student(collection, class_name: str, username: str):
+    await collection.update_one(
+        {"_id": class_name},
+        {"$inc": {"students_count": 1},
+         "$set": {f"students.{student_key(username)}.username": username, "updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+
+async def rebuild_class_rollups(db, progress_rows) -> int:
+    """Recompute every class rollup from students and an async iterator of all progress rows"""
+    classes: Dict[str, Dict] = {}
+    class_of = {}
+    async for student in db.students.find({}, {"_id": 0, "username": 1, "class_name": 1}):
+        class_name = student.get("class_name", "GR9-A")
+        class_of[student["username"]] = class_name
+        rollup = classes.setdefault(class_name, {"_id": class_name, "students_count": 0})
+        rollup["students_count"] += 1
+        rollup.setdefault("students", {})[student_key(student["username"])] = {"username": student["username"]}
+
+    async for row in progress_rows:
+        class_name = class_of.get(row["student_username"])
+        if class_name is None:
+            continue
+        increments = rollup_increments(row["student_username"], None, row)
+        rollup = classes[class_name]
+        for path, delta in increments.items():
+            target = rollup
+            *parents, leaf = path.split(".")
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = target.get(leaf, 0) + delta
+
+    await db.class_rollups.delete_many({})
+    if classes:
+        now = datetime.utcnow()
+        await db.class_rollups.insert_many([{**rollup, "updated_at": now} for rollup in classes.values()])
+    return len(classes)
+
+def _averages(counters: Dict, students_count: int, problems_count: int) -> Dict:
+    completed = counters.get("completed", 0)
+    possible = students_count * problems_count
+    return {
+        "completed_problems": completed,
+        "completion_rate": round(completed / possible * 100, 1) if possible else 0,
+        "average_score": round(counters.get("score_sum", 0) / completed, 1) if completed else 0,
+        "total_attempts": counters.get("attempts", 0),
+        "total_hints_used": counters.get("hints_used", 0),
+        "score_histogram": {
+            bucket: counters.get("score_histogram", {}).get(bucket, 0)
+            for bucket in (str(b) for b in range(0, 100, 10))
+        },
+    }
+
+def class_summary(rollup: Dict, top: int = TOP_STUDENTS) -> Dict:
+    """API view of a class rollup document"""
+    curriculum = load_curriculum()
+    students_count = rollup.get("students_count", 0)
+    sections = rollup.get("sections", {})
+
+    students = [s for s in rollup.get("students", {}).values() if s.get("completed", 0) > 0]
+    students.sort(key=lambda s: (-s.get("completed", 0), -s.get("score_sum", 0), s["username"]))
+    top_students: List[Dict] = [
+        {
+            "username": s["username"],
+            "completed_problems": s.get("completed", 0),
+            "average_score": round(s.get("score_sum", 0) / s["completed"], 1),
+            "total_attempts": s.get("attempts", 0),
+        }
+        for s in students[:top]
+    ]
+
+    return {
+        "class_name": rollup["_id"],
+        "students_count": students_count,
+        **_averages(rollup.get("totals", {}), students_count, len(curriculum.problems)),
+        "sections": {
+            section.id: _averages(sections.get(section.id, {}), students_count, len(section.problems))
+            for section in curriculum.sections
+        },
+        "top_students": top_students,
+        "updated_at": rollup.get("updated_at"),
+    }
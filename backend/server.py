@@ -1,24 +1,40 @@
 import logging
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, Header, HTTPException, Request
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import os
+import json
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
 # Import custom modules
 from models import (
     Student, StudentCreate, Progress, ProgressUpdate, ProblemAttempt,
-    Problem, Section, TeacherAuth, StudentStats, TeacherDashboard
+    Problem, Section, TeacherAuth, StudentStats, TeacherDashboard, Language, DashboardFormat
 )
 from database import (
     init_database, create_student, get_student, get_student_progress,
-    update_progress, get_section_problems, get_problem, get_all_students_stats,
-    students_collection, progress_collection, problems_collection, sections_collection
+    update_progress, get_section_problems, get_problem, resolve_problem_id,
+    get_class_summary, rebuild_class_rollups, progress_store, get_student_rewards, get_student_stats,
+    get_progress_revision, get_progress_changes, db, clear_student_data, record_activity, record_attempt,
+    get_recent_activity, idempotency_keys,
+    students_collection, progress_collection, problems_collection, sections_collection,
+    analytics_students_collection, analytics_progress_collection,
+    analytics_problems_collection, analytics_sections_collection, client, analytics_client
 )
-from utils import normalize_answer, calculate_score, calculate_badges, calculate_total_points
+from utils import calculate_score
+from compression import CompressionMiddleware, compressible
+from mongo_pool import pool_stats
+from singleflight import flights
+from problem_analytics import get_problem_analytics
+from catalog import get_section_payload, get_problem_payload, catalog_response, set_catalog_version, refresh_catalog_version
+from grading import GradingTimeout, grader, verdicts
+from events import broker
+from dashboard_cache import dashboard_cache
+from warmup import STARTUP_MODE, warmup_state, warm_up, start_warm_up
 
 # CRITICAL: Stage access control security functions
 def get_problem_type(problem_id: str) -> str:
@@ -150,20 +166,56 @@ async def logout():
 async def clear_all_data():
     """Clear all student records and progress data"""
     try:
-        # Delete all students
-        await students_collection.delete_many({})
-        # Delete all progress records
-        await progress_collection.delete_many({})
+        # Delete all students and progress records (and the class rollups built from them)
+        await clear_student_data()
+        dashboard_cache.clear()
         
         return {"message": "All student data cleared successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error clearing data: {str(e)}")
 
 # Student progress endpoints
+def progress_entry(progress: Progress) -> Dict:
+    return {
+        "completed": progress.completed,
+        "score": progress.score,
+        "attempts": progress.attempts
+    }
+
 @api_router.get("/students/{username}/progress")
-async def get_progress(username: str):
-    """Get student progress for all problems across all sections"""
+@compressible
+async def get_progress(username: str, since: Optional[int] = None):
+    """Get student progress for all problems across all sections
+
+    With ?since=<revision> (the "revision" of an earlier response) only the
+    problems written after it are returned, with "partial": true, or 304 when
+    nothing changed.
+    """
     try:
+        # The returned revision is the highest one among the rows read, never the
+        # student's counter: a revision is taken before its row is written, so
+        # the counter can be ahead of what this read saw
+        revision = await get_progress_revision(username)
+        if since is not None and since == revision:
+            return Response(status_code=304)
+
+        if since is not None and since < revision:
+            progress_dict = {}
+            changes = await get_progress_changes(username, since)
+            for progress in changes:
+                section_key = get_section_from_problem_id(progress.problem_id)
+                progress_dict.setdefault(section_key, {})[progress.problem_id] = progress_entry(progress)
+            student_rewards = await get_student_rewards(username)
+            return {
+                "progress": progress_dict,
+                "partial": True,
+                "revision": max([since] + [progress.revision for progress in changes]),
+                "total_points": student_rewards.get("total_points", 0),
+                "badges": student_rewards.get("badges", []),
+                "section_points": student_rewards.get("section_points", {}),
+                "section_badges": student_rewards.get("section_badges", {})
+            }
+
         progress_list = await get_student_progress(username)
         
         # Convert to dictionary format expected by frontend - support all sections
@@ -214,35 +266,47 @@ async def get_progress(username: str):
             section_key = f"section{section_num}"
             
             if section_key in progress_dict:
-                progress_dict[section_key][problem_id] = {
-                    "completed": progress.completed,
-                    "score": progress.score,
-                    "attempts": progress.attempts
-                }
+                progress_dict[section_key][problem_id] = progress_entry(progress)
         
-        # Calculate total points and badges (for section 1 compatibility)
-        try:
-            problems = await get_section_problems("section1")
-            problems_dict = {p.id: {"weight": p.weight} for p in problems}
-            
-            total_points = calculate_total_points(progress_dict["section1"], problems_dict)
-            badges = calculate_badges(progress_dict["section1"])
-        except:
-            total_points = 0
-            badges = []
+        # Points and badges are maintained on the student document by update_progress
+        student_rewards = await get_student_rewards(username)
         
         return {
             "progress": progress_dict,
-            "total_points": total_points,
-            "badges": badges
+            "partial": False,
+            "revision": max([0] + [progress.revision for progress in progress_list]),
+            "total_points": student_rewards.get("total_points", 0),
+            "badges": student_rewards.get("badges", []),
+            "section_points": student_rewards.get("section_points", {}),
+            "section_badges": student_rewards.get("section_badges", {})
         }
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+async def record_activity_safely(username: str, section_id: str, correct: bool = False, stage_update: bool = False):
+    """Activity counters are best effort - never fail the student's write because of them"""
+    try:
+        await record_activity(username, section_id, correct, stage_update)
+    except Exception as e:
+        logging.error(f"Error recording activity: {e}")
+
+async def record_attempt_safely(username: str, attempt: ProblemAttempt, attempt_number: int, correct: bool, catalog_version: int):
+    """The attempt log only feeds regrades - never fail the student's write because of it"""
+    try:
+        await record_attempt(username, attempt.problem_id, attempt.answer, attempt.hints_used,
+                             attempt_number, correct, catalog_version)
+    except Exception as e:
+        logging.error(f"Error recording attempt: {e}")
+
 @api_router.post("/updateProgress")
-async def update_progress_endpoint(progress_update: dict):
-    """Update progress status for stage completion"""
+async def update_progress_endpoint(progress_update: dict, idempotency_key: Optional[str] = Header(None)):
+    """Update progress status for stage completion; a retry with the same Idempotency-Key gets the first response"""
+    scope = f"progress:{progress_update.get('username')}"
+    return await idempotency_keys.run(scope, idempotency_key, progress_update,
+                                      lambda: apply_progress_update(progress_update))
+
+async def apply_progress_update(progress_update: dict):
     try:
         username = progress_update.get("username")
         section = progress_update.get("section")
@@ -251,6 +315,7 @@ async def update_progress_endpoint(progress_update: dict):
         
         if not all([username, section, stage, status]):
             raise HTTPException(status_code=400, detail="Missing required fields")
+        stage = resolve_problem_id(stage, f"section{section}")
         
         # Get current progress for the stage
         current_progress = await get_student_progress(username)
@@ -272,6 +337,7 @@ async def update_progress_endpoint(progress_update: dict):
         }
         
         updated_progress = await update_progress(username, stage, progress_data)
+        await record_activity_safely(username, section_id, stage_update=True)
         
         return {
             "success": True,
@@ -283,9 +349,15 @@ async def update_progress_endpoint(progress_update: dict):
         raise HTTPException(status_code=400, detail=str(e))
 
 @api_router.post("/students/{username}/attempt")
-async def submit_attempt(username: str, attempt: ProblemAttempt):
-    """Submit a problem attempt with stage access control"""
+async def submit_attempt(username: str, attempt: ProblemAttempt, idempotency_key: Optional[str] = Header(None)):
+    """Submit a problem attempt with stage access control; a retry with the same Idempotency-Key gets the first response"""
+    return await idempotency_keys.run(f"attempt:{username}", idempotency_key, attempt,
+                                      lambda: grade_attempt(username, attempt))
+
+async def grade_attempt(username: str, attempt: ProblemAttempt):
     try:
+        attempt.problem_id = resolve_problem_id(attempt.problem_id)
+        
         # CRITICAL SECURITY: Check stage access before allowing attempt
         access_check = await check_stage_access_security(username, attempt.problem_id)
         if not access_check["access"]:
@@ -318,9 +390,13 @@ async def submit_attempt(username: str, attempt: ProblemAttempt):
         new_attempts = current_attempts + 1
         
         # Check if answer is correct - enhanced for preparation stage
-        normalized_answer = normalize_answer(attempt.answer, problem.type, problem.answer)
-        normalized_correct = normalize_answer(problem.answer, problem.type, problem.answer)
-        is_correct = normalized_answer == normalized_correct
+        catalog_version = await refresh_catalog_version()
+        try:
+            verdict = await grader.grade(catalog_version, problem, attempt.answer)
+        except GradingTimeout:
+            # Nothing is recorded, so the retry is not counted as another attempt
+            raise HTTPException(status_code=503, detail="Grading took too long, please submit again")
+        is_correct = verdict["correct"]
         
         # Calculate score
         score = calculate_score(new_attempts, attempt.hints_used, is_correct)
@@ -340,7 +416,9 @@ async def submit_attempt(username: str, attempt: ProblemAttempt):
         }
         
         updated_progress = await update_progress(username, attempt.problem_id, progress_data)
+        await record_attempt_safely(username, attempt, new_attempts, is_correct, catalog_version)
         await handle_section_completion(username, section_id, attempt.problem_id)
+        await record_activity_safely(username, section_id, is_correct)
         
         return {
             "correct": is_correct,
@@ -349,27 +427,34 @@ async def submit_attempt(username: str, attempt: ProblemAttempt):
             "progress": updated_progress
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 # Problems endpoints
 @api_router.get("/problems/section/{section_id}", response_model=list[Problem])
-async def get_section_problems_endpoint(section_id: str):
-    """Get all problems for a section"""
+async def get_section_problems_endpoint(section_id: str, request: Request, lang: Language = None):
+    """Get all problems for a section, optionally projected to a single language"""
     try:
         logging.warning(f"--- DEBUG: Received request for section_id: {section_id} ---")
         
-        problems = await get_section_problems(section_id)
-        return problems
+        # Served from the per-catalog-version cache, precompressed when possible
+        payload = await get_section_payload(section_id, lang)
+        if payload is None:
+            return []
+        return catalog_response(payload, request.headers.get("accept-encoding"))
     except Exception as e:
         # This will log the full error and send the error message back to the browser
         logging.error(f"--- ERROR in get_section_problems_endpoint: {e} ---", exc_info=True)
         raise HTTPException(status_code=400, detail=f"Error fetching problems: {str(e)}")
 
 @api_router.get("/problems/{problem_id}", response_model=Problem)
-async def get_problem_endpoint(problem_id: str, username: str = None):
-    """Get specific problem details with stage access control"""
+async def get_problem_endpoint(problem_id: str, request: Request, username: str = None, lang: Language = None):
+    """Get specific problem details with stage access control, optionally projected to a single language"""
     try:
+        problem_id = resolve_problem_id(problem_id)
+        
         # CRITICAL SECURITY: Require username for protected stages (assessment, examprep)
         problem_type = get_problem_type(problem_id)
         if problem_type in ['assessment', 'examprep'] and not username:
@@ -395,10 +480,10 @@ async def get_problem_endpoint(problem_id: str, username: str = None):
                     }
                 )
         
-        problem = await get_problem(problem_id)
-        if not problem:
+        payload = await get_problem_payload(problem_id, lang)
+        if payload is None:
             raise HTTPException(status_code=404, detail="Problem not found")
-        return problem
+        return catalog_response(payload, request.headers.get("accept-encoding"))
     except HTTPException:
         raise
     except Exception as e:
@@ -455,11 +540,41 @@ async def handle_section_completion(username: str, section_id: str, problem_id:
         # Don't raise - just log the error to prevent breaking the flow
 
 # Teacher dashboard endpoints
+STUDENT_FIELDS = (
+    "username", "class_name", "progress_percentage", "completed_problems", "total_problems",
+    "weighted_score", "total_attempts", "last_activity",
+)
+
+def columnar_students(stats: List[Dict]) -> Dict:
+    """
+    format=columnar: one array per field instead of one dict per student, and
+    problems_status packed against a single problem id list - bit i of
+    `completed` and entry i of `scores`/`attempts` belong to problem_ids[i].
+    (The catalog has 30 problems, well within JavaScript's 53 safe integer bits.)
+    """
+    problem_ids = list(stats[0]["problems_status"]) if stats else []
+    columns = {field: [s[field] for s in stats] for field in STUDENT_FIELDS}
+    columns["completed"] = []
+    columns["scores"] = []
+    columns["attempts"] = []
+    for s in stats:
+        status = s["problems_status"]
+        entries = [status.get(problem_id, {}) for problem_id in problem_ids]
+        columns["completed"].append(sum(1 << i for i, e in enumerate(entries) if e.get("completed")))
+        columns["scores"].append([e.get("score", 0) for e in entries])
+        columns["attempts"].append([e.get("attempts", 0) for e in entries])
+    return {"format": "columnar", "count": len(stats), "problem_ids": problem_ids, "columns": columns}
+
+def format_students(stats: List[Dict], format: DashboardFormat):
+    return columnar_students(stats) if format == DashboardFormat.COLUMNAR else stats
+
 @api_router.get("/teacher/students")
-async def get_teacher_dashboard(class_filter: str = None):
-    """Get all student statistics for teacher dashboard, optionally filtered by class"""
+@compressible
+async def get_teacher_dashboard(class_filter: str = None, format: DashboardFormat = DashboardFormat.ROWS):
+    """Get all student statistics for teacher dashboard, optionally filtered by class (format=columnar packs the rows)"""
     try:
-        students_stats = await get_all_students_stats(class_filter)
+        # An empty filter is no filter, so it shares the cache entry of all classes
+        students_stats, cache_age = await dashboard_cache.get(class_filter or None)
         
         if not students_stats:
             return {
@@ -467,7 +582,8 @@ async def get_teacher_dashboard(class_filter: str = None):
                 "average_progress": 0,
                 "completed_problems": 0,
                 "average_score": 0,
-                "students": []
+                "students": format_students([], format),
+                "cache_age_seconds": 0
             }
         
         # Calculate overall statistics
@@ -481,17 +597,45 @@ async def get_teacher_dashboard(class_filter: str = None):
             "average_progress": round(average_progress),
             "completed_problems": completed_problems,
             "average_score": round(average_score),
-            "students": students_stats
+            "students": format_students(students_stats, format),
+            "cache_age_seconds": round(cache_age, 1)
         }
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+EVENTS_HEARTBEAT_SECONDS = float(os.environ.get('EVENTS_HEARTBEAT_SECONDS', '15'))
+
+@api_router.get("/teacher/events")
+async def teacher_events(request: Request, class_filter: str = None):
+    """Server-sent events with a student's updated dashboard row whenever their progress changes"""
+    subscription = broker.subscribe(class_filter)
+
+    async def stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                message = await subscription.next(EVENTS_HEARTBEAT_SECONDS)
+                if message is None:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['event']}\ndata: {json.dumps(message['data'], default=str)}\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @api_router.get("/teacher/dashboard")
-async def get_teacher_dashboard_new(class_filter: str = None):
-    """Teacher dashboard with student statistics, optionally filtered by class"""
+@compressible
+async def get_teacher_dashboard_new(class_filter: str = None, format: DashboardFormat = DashboardFormat.ROWS):
+    """Teacher dashboard with student statistics, optionally filtered by class (format=columnar packs the rows)"""
     try:
-        stats = await get_all_students_stats(class_filter)
+        stats, cache_age = await dashboard_cache.get(class_filter or None)
         
         if not stats:
             return {
@@ -499,8 +643,9 @@ async def get_teacher_dashboard_new(class_filter: str = None):
                 "average_progress": 0,
                 "completed_problems": 0,
                 "average_score": 0,
-                "students": [],
-                "class_filter": class_filter
+                "students": format_students([], format),
+                "class_filter": class_filter,
+                "cache_age_seconds": 0
             }
         
         total_students = len(stats)
@@ -513,13 +658,55 @@ async def get_teacher_dashboard_new(class_filter: str = None):
             "average_progress": round(average_progress, 1),
             "completed_problems": total_completed,
             "average_score": round(average_score, 1),
-            "students": stats,
-            "class_filter": class_filter
+            "students": format_students(stats, format),
+            "class_filter": class_filter,
+            "cache_age_seconds": round(cache_age, 1)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/teacher/classes/{class_name}/summary")
+async def get_class_summary_endpoint(class_name: str, top: int = 5):
+    """Class averages, per-section completion/score histograms and top students from one rollup document"""
+    try:
+        summary = await get_class_summary(class_name, max(top, 0))
+        if summary is None:
+            raise HTTPException(status_code=404, detail="No data for this class")
+        return summary
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.get("/teacher/problems/analytics")
+@compressible
+async def get_problems_analytics(class_filter: str = None, section_id: str = None):
+    """Per-problem completion, attempts, hints and time-to-solve distributions, hardest first"""
+    try:
+        return await get_problem_analytics(class_filter, section_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.get("/teacher/activity")
+async def get_teacher_activity(class_filter: str = None, minutes: int = 15):
+    """Live view: graded attempts, correct answers, stage updates and active students per minute over the last N minutes"""
+    if not 1 <= minutes <= 24 * 60:
+        raise HTTPException(status_code=400, detail="minutes must be between 1 and 1440")
+    try:
+        return await get_recent_activity(minutes, class_filter)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Admin endpoints
+@api_router.post("/admin/rebuild-rollups")
+async def rebuild_rollups():
+    """Recompute the class rollups from students and progress (after manual data fixes)"""
+    try:
+        classes = await rebuild_class_rollups()
+        return {"message": "Class rollups rebuilt", "classes": classes}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @api_router.post("/admin/clear-test-data")
 async def clear_test_data(admin_key: str = "admin123"):
     """Clear all test data - for development only"""
@@ -527,61 +714,88 @@ async def clear_test_data(admin_key: str = "admin123"):
         raise HTTPException(status_code=403, detail="Invalid admin key")
     
     try:
-        # Clear all student data
-        student_result = await students_collection.delete_many({})
-        
-        # Clear all progress data
-        progress_result = await progress_collection.delete_many({})
+        # Clear all student and progress data
+        deleted = await clear_student_data()
+        dashboard_cache.clear()
         
         return {
             "message": "Test data cleared successfully",
-            "students_deleted": student_result.deleted_count,
-            "progress_deleted": progress_result.deleted_count
+            **deleted
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error clearing data: {str(e)}")
 
 @api_router.get("/admin/stats")
 async def get_admin_stats():
-    """Get admin statistics about data storage"""
+    """Get admin statistics about data storage (analytics read path)"""
     try:
-        student_count = await students_collection.count_documents({})
-        progress_count = await progress_collection.count_documents({})
-        problem_count = await problems_collection.count_documents({})
-        section_count = await sections_collection.count_documents({})
+        student_count = await analytics_students_collection.count_documents({})
+        progress_count = await analytics_progress_collection.count_documents({})
+        progress_storage = await progress_store.count()
+        problem_count = await analytics_problems_collection.count_documents({})
+        section_count = await analytics_sections_collection.count_documents({})
         
         return {
             "total_students": student_count,
             "total_progress_records": progress_count,
             "total_problems": problem_count,
             "total_sections": section_count,
+            "progress_layout": progress_store.name,
+            "progress_storage": progress_storage,
             "database_status": "connected"
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting stats: {str(e)}")
 
+@api_router.get("/admin/pool-stats")
+async def get_pool_stats(reset: bool = False):
+    """Connection pool metrics of this worker per client (checkout waits in ms); reset=true starts a new window"""
+    return {"pid": os.getpid(), "pools": pool_stats(reset)}
+
+@api_router.get("/admin/coalescing-stats")
+async def get_coalescing_stats(reset: bool = False):
+    """Single-flight counters of this worker: calls, queries actually run and calls that shared one"""
+    stats = flights.snapshot()
+    if reset:
+        flights.reset()
+    return {"pid": os.getpid(), "functions": stats}
+
+@api_router.get("/admin/verdict-cache-stats")
+async def get_verdict_cache_stats(reset: bool = False):
+    """Answer verdict cache hit rate and inline/offloaded grading counts of this worker; reset=true zeroes the counters"""
+    stats = {"verdicts": verdicts.snapshot(), "executor": grader.snapshot()}
+    if reset:
+        verdicts.reset()
+        grader.reset()
+    return {"pid": os.getpid(), **stats}
+
 # Health check endpoint
 @api_router.get("/")
 async def root():
     return {"message": "Math Tutoring API is running", "version": "1.0.0"}
 
+@api_router.get("/ready")
+async def readiness():
+    """Readiness probe - 200 once the warm-up finished with its required steps done (degraded if another step gave up)"""
+    status = warmup_state.to_dict()
+    if not warmup_state.ready:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
 # Admin endpoint to reset database
 @api_router.post("/admin/reset-db")
 async def reset_database():
-    """Reset and reinitialize database - for development only"""
+    """Reset student data and resync the curriculum - for development only"""
     try:
-        from database import problems_collection, sections_collection, students_collection, progress_collection
+        # Clear student data
+        await clear_student_data()
+        dashboard_cache.clear()
         
-        # Clear all collections
-        await problems_collection.delete_many({})
-        await sections_collection.delete_many({})
-        await students_collection.delete_many({})
-        await progress_collection.delete_many({})
+        # Resync the catalog in place so it is never empty
+        report = await init_database(force=True)
+        set_catalog_version(report["catalog_version"])
         
-        # Reinitialize
-        await init_database()
-        
-        return {"message": "Database reset and reinitialized successfully"}
+        return {"message": "Database reset and reinitialized successfully", "curriculum": report}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -590,8 +804,19 @@ app.include_router(api_router)
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
-    await init_database()
+    """Initialize database on startup, in the background unless STARTUP_MODE=blocking"""
+    broker.add_listener(dashboard_cache.on_event)
+    await broker.start(db, get_student_stats)
+    if STARTUP_MODE == "blocking":
+        await warm_up()
+    else:
+        start_warm_up()
+
+@app.middleware("http")
+async def record_first_request(request: Request, call_next):
+    """Record when the first request was served to measure time-to-first-request"""
+    warmup_state.mark_request()
+    return await call_next(request)
 
 app.add_middleware(
     CORSMiddleware,
@@ -601,6 +826,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses of routes marked with @compressible
+app.add_middleware(CompressionMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -611,4 +839,7 @@ logger = logging.getLogger(__name__)
 @app.on_event("shutdown")
 async def shutdown_db_client():
     """Cleanup on shutdown"""
-    pass
+    await broker.stop()
+    grader.stop()
+    analytics_client.close()
+    client.close()
@@ -0,0 +1,67 @@
+"""
+Single-flight coalescing for hot shared reads.
+
+When a lesson starts, a class of students asks for the same section within a
+second and several teachers load the same dashboard. While a call of a
+@single_flight function is running, identical calls (same arguments) wait
+for its result instead of sending their own queries.
+
+Nothing is cached: once the call finishes, the next one queries again. The
+result object is shared by every caller of that flight, so callers must not
+mutate it.
+"""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+class SingleFlight:
+    def __init__(self):
+        self._flights: Dict[Tuple, asyncio.Task] = {}
+        self.reset()
+
+    def reset(self):
+        self._stats: Dict[str, Dict] = {}
+
+    def _counters(self, name: str) -> Dict:
+        return self._stats.setdefault(name, {"calls": 0, "executions": 0, "coalesced": 0})
+
+    async def do(self, name: str, key: Hashable, call: Callable[[], Awaitable]):
+        counters = self._counters(name)
+        counters["calls"] += 1
+        flight = self._flights.get((name, key))
+        if flight is None:
+            counters["executions"] += 1
+            # A task, so a caller that disconnects does not cancel the others' read
+            flight = asyncio.ensure_future(call())
+            self._flights[(name, key)] = flight
+            flight.add_done_callback(functools.partial(self._landed, (name, key)))
+        else:
+            counters["coalesced"] += 1
+        return await asyncio.shield(flight)
+
+    def _landed(self, flight_key: Tuple, flight: asyncio.Task):
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+        if not flight.cancelled():
+            # Retrieved here so a flight whose callers all left does not log a warning
+            flight.exception()
+
+    def snapshot(self) -> Dict:
+        result = {}
+        for name, counters in self._stats.items():
+            stats = dict(counters)
+            stats["coalesced_pct"] = round(counters["coalesced"] / counters["calls"] * 100, 1) if counters["calls"] else 0
+            stats["in_flight"] = sum(1 for flight_name, _ in self._flights if flight_name == name)
+            result[name] = stats
+        return result
+
+flights = SingleFlight()
+
+def single_flight(fn):
+    """Coalesce concurrent calls of an async function with equal arguments"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        return await flights.do(fn.__name__, key, lambda: fn(*args, **kwargs))
+    return wrapper
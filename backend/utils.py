@@ -12,37 +12,47 @@ def convert_to_western_numerals(text: str) -> str:
                         '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9'}
     return re.sub(r'[٠-٩]', lambda x: arabic_to_western[x.group()], text)
 
+# Longest answer accepted from students (ProblemAttempt.answer); normalization
+# is linear, this keeps the work per request small as well
+MAX_ANSWER_LENGTH = 500
+
+# Arabic numerals and variables to their Western equivalents, in one pass
+_WESTERN = str.maketrans({
+    '٠': '0', '١': '1', '٢': '2', '٣': '3', '٤': '4',
+    '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9',
+    'س': 'x', 'ص': 'y', 'ك': 'k', 'م': 'm', 'ن': 'n',
+    '÷': '/', '×': '*',
+})
+
+# The patterns below run on student input, so none of them may backtrack more
+# than linearly: a number is -?\d+(?:\.\d*)? (one way to split the digits, where
+# -?\d+\.?\d* had quadratically many), and operators only strip the single
+# space left after whitespace is collapsed
+_NUMBER = r'-?\d+(?:\.\d*)?'
+_PARENTHESIZED_NUMBER = re.compile(r'\(\s*(' + _NUMBER + r')\s*\)')
+_PARENTHESIZED_FRACTION = re.compile(r'\(\s*(' + _NUMBER + r')\s*\)/\(\s*(' + _NUMBER + r')\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+_SPACED_OPERATOR = re.compile(r' ?([+\-*/=<>≤≥]) ?')
+
 def basic_normalize_answer(answer: str) -> str:
     """Basic normalization without preparation stage logic - ENHANCED for global negative number validation"""
     if not answer:
         return ''
     
-    # Convert Arabic numerals to Western
-    normalized = convert_to_western_numerals(answer.lower().strip())
-    
-    # GLOBAL ENHANCEMENT: Convert ALL Arabic variables to Western equivalents
-    arabic_to_western_vars = {
-        'س': 'x', 'ص': 'y', 'ك': 'k', 'م': 'm', 'ن': 'n'
-    }
-    for arabic_var, western_var in arabic_to_western_vars.items():
-        normalized = normalized.replace(arabic_var, western_var)
+    # Convert Arabic numerals, ALL Arabic variables and ÷/× to Western equivalents
+    normalized = answer.lower().strip().translate(_WESTERN)
     
     # GLOBAL ENHANCEMENT: Handle parentheses around negative numbers
     # Convert (-5) to -5, (-12) to -12, etc.
-    normalized = re.sub(r'\(\s*(-?\d+\.?\d*)\s*\)', r'\1', normalized)
+    normalized = _PARENTHESIZED_NUMBER.sub(r'\1', normalized)
     
     # GLOBAL ENHANCEMENT: Handle fractions with parentheses
     # Convert (-3)/(-6) to -3/-6
-    normalized = re.sub(r'\(\s*(-?\d+\.?\d*)\s*\)/\(\s*(-?\d+\.?\d*)\s*\)', r'\1/\2', normalized)
-    
-    # Normalize operators and spaces more carefully
-    normalized = re.sub(r'÷', '/', normalized)  # Convert ÷ to /
-    normalized = re.sub(r'×', '*', normalized)  # Convert × to *
-    normalized = re.sub(r'\s+', ' ', normalized)  # Normalize multiple spaces to single
-    normalized = re.sub(r'\s*([+\-*/=])\s*', r'\1', normalized)  # Remove spaces around basic operators
-    normalized = re.sub(r'\s*([<>])\s*', r'\1', normalized)  # Remove spaces around inequality signs
-    normalized = re.sub(r'\s*([≤≥])\s*', r'\1', normalized)  # Remove spaces around unicode inequalities
-    normalized = re.sub(r'\s*([<>]=?)\s*', r'\1', normalized)  # Handle <= >= combinations
+    normalized = _PARENTHESIZED_FRACTION.sub(r'\1/\2', normalized)
+    
+    # Normalize spaces, then remove them around operators and (unicode) inequality signs
+    normalized = _WHITESPACE.sub(' ', normalized)
+    normalized = _SPACED_OPERATOR.sub(r'\1', normalized)
     
     return normalized
 
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from catalog import get_problem_payload, get_section_payload, set_catalog_version
+from content import load_curriculum
+from grading import grader
+from database import (
+    ensure_class_rollups, ensure_indexes, get_recent_students, get_student_progress, init_database, load_problem_id_renames,
+    client, analytics_client, ANALYTICS_MIN_POOL_SIZE
+)
+from models import Language
+from mongo_pool import MONGO_MIN_POOL_SIZE, prewarm
+
+# "background" starts serving immediately and warms up in a task,
+# "blocking" keeps the old behaviour of warming up before accepting traffic
+STARTUP_MODE = os.environ.get('STARTUP_MODE', 'background')
+HOT_STUDENTS_HOURS = int(os.environ.get('WARMUP_HOT_STUDENTS_HOURS', '24'))
+HOT_STUDENTS_LIMIT = int(os.environ.get('WARMUP_HOT_STUDENTS_LIMIT', '200'))
+# Failed steps are retried with exponential backoff from 1s up to this pause
+WARMUP_RETRY_ATTEMPTS = int(os.environ.get('WARMUP_RETRY_ATTEMPTS', '5'))
+WARMUP_RETRY_MAX_SECONDS = float(os.environ.get('WARMUP_RETRY_MAX_SECONDS', '30'))
+
+logger = logging.getLogger(__name__)
+
+# Set when the module is imported, which is as close to process start as the app gets
+PROCESS_STARTED = time.monotonic()
+
+class WarmupState:
+    """Progress of the startup warm-up, reported by the readiness endpoint"""
+
+    STEPS = ("connections", "catalog", "indexes", "rollups", "payloads", "hot_students", "grading")
+    # Requests cannot be served without these; the others only make them faster
+    REQUIRED_STEPS = ("connections", "catalog")
+
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.first_request_at: Optional[float] = None
+        self.steps: Dict[str, str] = {step: "pending" for step in self.STEPS}
+        self.error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.finished_at is not None and all(self.steps[step] == "done" for step in self.REQUIRED_STEPS)
+
+    @property
+    def degraded(self) -> bool:
+        """Ready, but an optional step gave up"""
+        return self.ready and "failed" in self.steps.values()
+
+    def mark_request(self):
+        if self.first_request_at is None:
+            self.first_request_at = time.monotonic()
+
+    def to_dict(self) -> Dict:
+        def since_start(timestamp):
+            return round((timestamp - PROCESS_STARTED) * 1000) if timestamp else None
+
+        return {
+            "ready": self.ready,
+            "degraded": self.degraded,
+            "mode": STARTUP_MODE,
+            "steps": self.steps,
+            "error": self.error,
+            "warmup_started_ms": since_start(self.started_at),
+            "warmup_finished_ms": since_start(self.finished_at),
+            "time_to_first_request_ms": since_start(self.first_request_at),
+        }
+
+warmup_state = WarmupState()
+
+async def _run_step(name: str, step, attempts: Optional[int] = WARMUP_RETRY_ATTEMPTS):
+    """Run a warm-up step, retrying failures with backoff; attempts=None retries until it succeeds"""
+    delay = 1.0
+    attempt = 0
+    while True:
+        attempt += 1
+        warmup_state.steps[name] = "running"
+        started = time.monotonic()
+        try:
+            await step()
+        except Exception as e:
+            warmup_state.error = f"{name}: {e}"
+            if attempts is not None and attempt >= attempts:
+                warmup_state.steps[name] = "failed"
+                logger.error(f"Warm-up step {name} failed after {attempt} attempts: {e}", exc_info=True)
+                raise
+            warmup_state.steps[name] = "retrying"
+            logger.warning(f"Warm-up step {name} failed (attempt {attempt}), retrying in {delay:.0f}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+            continue
+        warmup_state.steps[name] = "done"
+        logger.info(f"Warm-up step {name} finished in {(time.monotonic() - started) * 1000:.0f} ms")
+        return
+
+async def _prewarm_connections():
+    # Open the minimum pools now so the first requests do not pay for connection setup
+    await prewarm(client, MONGO_MIN_POOL_SIZE)
+    await prewarm(analytics_client, ANALYTICS_MIN_POOL_SIZE)
+
+async def _sync_catalog():
+    report = await init_database()
+    await load_problem_id_renames()
+    set_catalog_version(report["catalog_version"])
+
+async def _warm_payloads():
+    # Serialize (and precompress on demand) every catalog payload once up front
+    curriculum = load_curriculum()
+    for lang in (None, Language.EN, Language.AR):
+        for section in curriculum.sections:
+            await get_section_payload(section.id, lang)
+            for problem in section.problems:
+                await get_problem_payload(problem.id, lang)
+
+async def _warm_hot_students():
+    # Reading recent students' progress pulls their documents into MongoDB's cache
+    since = datetime.utcnow() - timedelta(hours=HOT_STUDENTS_HOURS)
+    for username in await get_recent_students(since, HOT_STUDENTS_LIMIT):
+        await get_student_progress(username)
+
+async def warm_up(retry_required: bool = False):
+    """Open pooled connections, validate/seed the catalog, create indexes and warm caches
+
+    A required step that still fails after WARMUP_RETRY_ATTEMPTS raises, unless
+    retry_required keeps retrying it. Other steps that give up leave the
+    instance ready but degraded.
+    """
+    warmup_state.started_at = time.monotonic()
+    required_attempts = None if retry_required else WARMUP_RETRY_ATTEMPTS
+    try:
+        await _run_step("connections", _prewarm_connections, required_attempts)
+        await _run_step("catalog", _sync_catalog, required_attempts)
+        for name, step in (
+            ("indexes", ensure_indexes),
+            ("rollups", ensure_class_rollups),
+            ("payloads", _warm_payloads),
+            ("hot_students", _warm_hot_students),
+            ("grading", grader.start),
+        ):
+            try:
+                await _run_step(name, step)
+            except Exception:
+                # Logged by _run_step; requests are served without it
+                pass
+    finally:
+        warmup_state.finished_at = time.monotonic()
+
+_warmup_task: Optional[asyncio.Task] = None
+
+def start_warm_up() -> asyncio.Task:
+    """Start the warm-up in the background, the app keeps serving meanwhile"""
+    global _warmup_task
+    # Nothing else would retry it, and /ready stays 503 until the required steps succeed
+    _warmup_task = asyncio.create_task(warm_up(retry_required=True))
+    # Retrieve the exception so a failed warm-up does not log "never retrieved"
+    _warmup_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return _warmup_task
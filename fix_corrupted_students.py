@@ -1,100 +1,141 @@
-import pymongo
-from pymongo import MongoClient
-from bson import ObjectId
-import sys
-
-# IMPORTANT: Add your MongoDB connection string here
-MONGO_URI = "mongodb+srv://@cluster0.dip2jyt.mongodb.net/mathtutor?retryWrites=true&w=majority&appName=Cluster0"
-
-def fix_corrupted_students():
-    """Fix students like Somayya whose accounts are corrupted"""
-    
-    try:
-        client = MongoClient(MONGO_URI)
-        db = client.mathtutor  # or mathtutor - check your database name
-        
-        print("Connected to MongoDB!")
-        print("-" * 50)
-        
-        # Find all progress records
-        all_progress = list(db.progress.find({}))
-        
-        print(f"Found {len(all_progress)} progress records")
-        
-        # Group by student
-        students_progress = {}
-        for record in all_progress:
-            username = record.get('student_username', 'unknown')
-            if username not in students_progress:
-                students_progress[username] = []
-            students_progress[username].append(record)
-        
-        # Check each student
-        for username, progress_records in students_progress.items():
-            print(f"\nChecking {username}...")
-            
-            # Look for corruption patterns
-            has_examprep1 = any(p['problem_id'] == 'examprep1' and p.get('completed', False) 
-                               for p in progress_records)
-            has_prep2 = any(p['problem_id'] == 'prep2' for p in progress_records)
-            
-            # Count section 1 and section 2 problems
-            section1_problems = [p for p in progress_records if p.get('section_id') == 'section1']
-            section2_problems = [p for p in progress_records if p.get('section_id') == 'section2']
-            
-            print(f"  - Has completed examprep1: {has_examprep1}")
-            print(f"  - Has prep2: {has_prep2}")
-            print(f"  - Section 1 problems: {len(section1_problems)}")
-            print(f"  - Section 2 problems: {len(section2_problems)}")
-            
-            # Fix corruption
-            if has_examprep1 and not has_prep2:
-                print(f"  ⚠️ {username} completed Section 1 but no Section 2 prep - FIXING...")
-                
-                # Create prep2 entry
-                db.progress.insert_one({
-                    "student_username": username,
-                    "section_id": "section2",
-                    "problem_id": "prep2",
-                    "completed": False,
-                    "score": 0,
-                    "attempts": 0,
-                    "hints_used": 0
-                })
-                print(f"  ✅ Added prep2 for {username}")
-            
-            # Check for wrong section assignment
-            for record in progress_records:
-                problem_id = record.get('problem_id', '')
-                section_id = record.get('section_id', '')
-                
-                # Fix prep2 in wrong section
-                if problem_id == 'prep2' and section_id == 'section1':
-                    print(f"  ⚠️ Found prep2 in section1 - FIXING...")
-                    db.progress.update_one(
-                        {'_id': record['_id']},
-                        {'$set': {'section_id': 'section2'}}
-                    )
-                    print(f"  ✅ Moved prep2 to section2")
-        
-        print("\n" + "=" * 50)
-        print("✅ FIX COMPLETED!")
-        print("=" * 50)
-        
-        client.close()
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        print("\nPlease check:")
-        print("1. Your MongoDB connection string")
-        print("2. Your database name (mathtutor)")
+#!/usr/bin/env python3
+"""
+Fix students whose progress was corrupted when moving to the next section.
+
+Corruption patterns (see handle_section_completion in backend/server.py):
+1. examprepN is completed but there is no prep(N+1) progress entry
+2. prep(N+1) is filed under sectionN (e.g. prep2 in section1)
+
+Only prep entries are moved: legacy ids such as practice2 were used in every
+section, so their digit does not name their section (fix_database_naming.py
+renames those).
+
+Students are streamed from an aggregation grouped on student_username, so the
+detection runs in MongoDB and only corrupted students reach this script. The
+aggregation reads both progress layouts (progress_store.DocumentLayout), and
+students that have a progress_by_student document are repaired there.
+Sharding, batched writes, checkpoints and reporting come from repair_framework.
+
+Usage:
+    MONGO_URL=... DB_NAME=mathtutor python fix_corrupted_students.py --dry-run
+    MONGO_URL=... DB_NAME=mathtutor python fix_corrupted_students.py --workers 8 --yes
+"""
+
+from pymongo import UpdateOne
+
+from repair_framework import Repair, run_cli, range_query
+from progress_store import DOCUMENTS_COLLECTION, ROWS_COLLECTION, progress_layout
+
+LAST_SECTION = 5
+# prep(N+1) -> sectionN, where the old section transition wrote it
+MISFILED_PREPS = {f"prep{n + 1}": f"section{n}" for n in range(1, LAST_SECTION)}
+
+def prep_section(prep_id: str) -> str:
+    return f"section{prep_id.replace('prep', '')}"
+
+def new_entry(prep_id: str) -> dict:
+    """Progress of a prep that was never started"""
+    return {"section_id": prep_section(prep_id), "completed": False, "score": 0, "attempts": 0, "hints_used": 0}
+
+def corrupted_students_pipeline():
+    """Aggregation over progress rows that yields one document per corrupted student, in username order"""
+    return [
+        {"$group": {
+            "_id": "$student_username",
+            "completed_exampreps": {"$addToSet": {"$cond": [
+                {"$and": [
+                    "$completed",
+                    {"$regexMatch": {"input": "$problem_id", "regex": f"^examprep[1-{LAST_SECTION - 1}]$"}},
+                ]},
+                "$problem_id",
+                None,
+            ]}},
+            "preps": {"$addToSet": {"$cond": [
+                {"$regexMatch": {"input": "$problem_id", "regex": "^prep[0-9]+$"}},
+                "$problem_id",
+                None,
+            ]}},
+            "misplaced": {"$push": {"$cond": [
+                {"$or": [
+                    {"$and": [{"$eq": ["$problem_id", prep_id]}, {"$eq": ["$section_id", section_id]}]}
+                    for prep_id, section_id in MISFILED_PREPS.items()
+                ]},
+                "$problem_id",
+                None,
+            ]}},
+        }},
+        {"$project": {
+            "missing_preps": {"$setDifference": [
+                {"$map": {
+                    "input": {"$setDifference": ["$completed_exampreps", [None]]},
+                    "in": {"$concat": [
+                        "prep",
+                        {"$toString": {"$add": [{"$toInt": {"$substrCP": ["$$this", 8, 1]}}, 1]}},
+                    ]},
+                }},
+                "$preps",
+            ]},
+            "misplaced": {"$filter": {"input": "$misplaced", "cond": {"$ne": ["$$this", None]}}},
+        }},
+        {"$match": {"$or": [{"missing_preps.0": {"$exists": True}}, {"misplaced.0": {"$exists": True}}]}},
+        {"$sort": {"_id": 1}},
+    ]
+
+class FixCorruptedStudents(Repair):
+    name = "fix_corrupted_students"
+    description = "FAHHEMNI STUDENT DATA FIX - repair section transition corruption"
+
+    def source(self, db, lower, upper, after):
+        usernames = range_query("student_username", lower, upper, after).get("student_username")
+        return progress_layout(db, "document").aggregate(
+            corrupted_students_pipeline(), usernames=usernames, allowDiskUse=True
+        )
+
+    def key(self, student):
+        return student["_id"]
+
+    async def operations(self, db, student):
+        username = student["_id"]
+        if await db[DOCUMENTS_COLLECTION].find_one({"_id": username}, {"_id": 1}):
+            return self._document_operations(username, student)
+
+        operations = []
+        for prep_id in student["missing_preps"]:
+            # Upsert keeps the fix idempotent if the student created the entry meanwhile
+            operations.append((ROWS_COLLECTION, UpdateOne(
+                {"student_username": username, "problem_id": prep_id},
+                {"$setOnInsert": {"student_username": username, "problem_id": prep_id, **new_entry(prep_id)}},
+                upsert=True,
+            )))
+
+        for prep_id in student["misplaced"]:
+            operations.append((ROWS_COLLECTION, UpdateOne(
+                {"student_username": username, "problem_id": prep_id, "section_id": MISFILED_PREPS[prep_id]},
+                {"$set": {"section_id": prep_section(prep_id)}},
+            )))
+
+        return operations
+
+    def _document_operations(self, username, student):
+        # The student's rows are a stale copy once they have a document, so only the document is repaired
+        operations = []
+        for prep_id in student["missing_preps"]:
+            operations.append((DOCUMENTS_COLLECTION, UpdateOne(
+                {"_id": username, f"progress.{prep_id}": {"$exists": False}},
+                {"$set": {f"progress.{prep_id}": new_entry(prep_id)}},
+            )))
+
+        for prep_id in student["misplaced"]:
+            operations.append((DOCUMENTS_COLLECTION, UpdateOne(
+                {"_id": username, f"progress.{prep_id}.section_id": MISFILED_PREPS[prep_id]},
+                {"$set": {f"progress.{prep_id}.section_id": prep_section(prep_id)}},
+            )))
+
+        return operations
+
+    def describe(self, student, operations):
+        moves = [f"{prep_id}->{prep_section(prep_id)}" for prep_id in student["misplaced"]]
+        return f"{student['_id']}: add {student['missing_preps'] or '-'}, move {moves or '-'}"
 
 if __name__ == "__main__":
-    print("FAHHEMNI STUDENT DATA FIX")
-    print("=" * 50)
-    
-    response = input("This will fix corrupted student data. Continue? (yes/no): ")
-    if response.lower() == 'yes':
-        fix_corrupted_students()
-    else:
-        print("Cancelled.")
\ No newline at end of file
+    run_cli(FixCorruptedStudents())
@@ -1,51 +1,241 @@
-# Database Problem ID Fix Script
-# Run this to update practice naming in your database
-
-import pymongo
-from pymongo import MongoClient
-
-# Replace with your actual MongoDB connection string
-MONGO_URI = "mongodb+srv://@cluster0.dip2jyt.mongodb.net/mathtutor?retryWrites=true&w=majority&appName=Cluster0"
-
-def fix_problem_naming():
-    try:
-        # Connect to MongoDB
-        client = MongoClient(MONGO_URI)
-        db = client.mathtutor  # Replace with your database name
-        problems_collection = db.problems
-        
-        print("🔧 Starting problem ID migration...")
-        
-        # Fix Section 1: practice1 -> practice1_1, practice2 -> practice1_2
-        
-        # Update practice1 to practice1_1
-        result1 = problems_collection.update_one(
-            {"id": "practice1", "section_id": "section1"},
-            {"$set": {"id": "practice1_1"}}
-        )
-        print(f"✅ Updated practice1 -> practice1_1: {result1.modified_count} documents")
-        
-        # Update practice2 to practice1_2  
-        result2 = problems_collection.update_one(
-            {"id": "practice2", "section_id": "section1"},
-            {"$set": {"id": "practice1_2"}}
+#!/usr/bin/env python3
+"""
+Database Problem ID Fix Script
+Renames problem ids in the problems collection AND in all student progress:
+practice1 -> practice1_1, practice2 -> practice1_2 (section 1)
+
+- Progress rows are renamed server-side with pipeline updateMany calls,
+  batched through bulk_write; progress is never loaded into Python wholesale.
+- Students with a progress_by_student document (progress_store.DocumentLayout)
+  have the entries of that document renamed the same way.
+- When a student already has a row (or entry) under the new id, the two are
+  merged (best completion/score/attempts kept) and the old one is removed.
+- The rename map is published in the problem_id_renames collection; the API
+  translates old ids through it during the transition window.
+- Counts are verified after the run; it fails while any row or document
+  still uses an old id, so the transition window is only safe to end then.
+
+Usage:
+    MONGO_URL=... DB_NAME=mathtutor python fix_database_naming.py --dry-run
+    MONGO_URL=... DB_NAME=mathtutor python fix_database_naming.py --transition-days 30 --yes
+"""
+
+from datetime import datetime, timedelta
+
+from pymongo import DeleteOne, UpdateMany, UpdateOne
+
+from repair_framework import Repair, range_query, run_cli
+from progress_store import DOCUMENTS_COLLECTION, ROWS_COLLECTION
+
+RENAMES = [
+    {"section_id": "section1", "old_id": "practice1", "new_id": "practice1_1"},
+    {"section_id": "section1", "old_id": "practice2", "new_id": "practice1_2"},
+]
+
+# Fields kept from the best of two entries when both ids exist, with their defaults
+MERGED_FIELDS = {"completed": False, "score": 0, "attempts": 0, "hints_used": 0}
+
+def old_rows_query(renames=RENAMES):
+    """Progress rows that still use an old id in the renamed section"""
+    return {"$or": [
+        {"section_id": rename["section_id"], "problem_id": rename["old_id"]}
+        for rename in renames
+    ]}
+
+def old_documents_query(renames=RENAMES):
+    """progress_by_student documents that still have an entry under an old id in the renamed section"""
+    return {"$or": [
+        {f"progress.{rename['old_id']}.section_id": rename["section_id"]}
+        for rename in renames
+    ]}
+
+def rename_pipeline(renames=RENAMES):
+    """Update pipeline mapping old ids to new ids (evaluated by MongoDB)"""
+    return [{"$set": {"problem_id": {"$switch": {
+        "branches": [
+            {
+                "case": {"$and": [
+                    {"$eq": ["$section_id", rename["section_id"]]},
+                    {"$eq": ["$problem_id", rename["old_id"]]},
+                ]},
+                "then": rename["new_id"],
+            }
+            for rename in renames
+        ],
+        "default": "$problem_id",
+    }}}}]
+
+async def row_rename_operations(db, username, old_rows, renames=RENAMES):
+    """Writes renaming one student's old-id rows, and how many of them are merged"""
+    new_ids = {
+        (r["section_id"], r["old_id"]): r["new_id"] for r in renames
+    }
+    targets = [new_ids[(row["section_id"], row["problem_id"])] for row in old_rows]
+    existing = await db[ROWS_COLLECTION].distinct(
+        "problem_id", {"student_username": username, "problem_id": {"$in": targets}}
+    )
+
+    operations = []
+    merged_ids = []
+    for row, new_id in zip(old_rows, targets):
+        if new_id in existing:
+            # Both ids exist for this student - keep the best of both rows
+            operations.append((ROWS_COLLECTION, UpdateOne(
+                {"student_username": username, "problem_id": new_id},
+                {"$max": {field: row.get(field, default) for field, default in MERGED_FIELDS.items()}},
+            )))
+            operations.append((ROWS_COLLECTION, DeleteOne({"_id": row["_id"]})))
+            merged_ids.append(row["_id"])
+
+    if len(merged_ids) < len(targets):
+        # bulk_write is unordered, so merged rows are excluded from the rename
+        operations.append((ROWS_COLLECTION, UpdateMany(
+            {"student_username": username, "_id": {"$nin": merged_ids}, **old_rows_query(renames)},
+            rename_pipeline(renames),
+        )))
+    return operations, len(merged_ids)
+
+async def document_rename_operations(db, username, renames=RENAMES):
+    """Writes renaming the old-id entries of one student's progress document, and how many of them are merged"""
+    document = await db[DOCUMENTS_COLLECTION].find_one(
+        {"_id": username},
+        {f"progress.{problem_id}": 1 for r in renames for problem_id in (r["old_id"], r["new_id"])},
+    )
+    progress = (document or {}).get("progress", {})
+
+    query = {"_id": username}
+    update = {"$rename": {}, "$max": {}, "$unset": {}}
+    merged = 0
+    for rename in renames:
+        entry = progress.get(rename["old_id"])
+        if not entry or entry.get("section_id") != rename["section_id"]:
+            continue
+        old, new = f"progress.{rename['old_id']}", f"progress.{rename['new_id']}"
+        if rename["new_id"] in progress:
+            # Both ids exist for this student - keep the best of both entries
+            update["$max"].update({f"{new}.{field}": entry.get(field, default) for field, default in MERGED_FIELDS.items()})
+            update["$unset"][old] = ""
+            merged += 1
+        else:
+            update["$rename"][old] = new
+            # $rename would overwrite an entry the API wrote under the new id meanwhile;
+            # the update then does nothing and verify reports the student as left over
+            query[new] = {"$exists": False}
+
+    update = {operator: fields for operator, fields in update.items() if fields}
+    if not update:
+        return [], 0
+    return [(DOCUMENTS_COLLECTION, UpdateOne(query, update))], merged
+
+class FixProblemNaming(Repair):
+    name = "fix_database_naming"
+    description = "🔧 Problem ID migration - rename problem ids in problems and progress"
+
+    def __init__(self):
+        self.counts = {}
+        self.merged = 0
+        self.merged_entries = 0
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transition-days", type=int, default=30,
+                            help="How long the API keeps translating old ids (0 = forever)")
+
+    async def _count(self, db):
+        return {
+            "old_rows": await db.progress.count_documents(old_rows_query()),
+            "new_rows": await db.progress.count_documents(
+                {"problem_id": {"$in": [r["new_id"] for r in RENAMES]}}
+            ),
+            "old_documents": await db[DOCUMENTS_COLLECTION].count_documents(old_documents_query()),
+        }
+
+    async def setup(self, db, args):
+        self.counts = await self._count(db)
+        print(f"Progress rows with old ids: {self.counts['old_rows']}, with new ids: {self.counts['new_rows']}")
+        print(f"Progress documents with old ids: {self.counts['old_documents']}")
+        if args.dry_run:
+            return
+
+        # Publish the rename map first so the API accepts both ids from now on
+        expires_at = datetime.utcnow() + timedelta(days=args.transition_days) if args.transition_days else None
+        for rename in RENAMES:
+            # One entry per section: the same old id can name problems of other sections
+            await db.problem_id_renames.update_one(
+                {"_id": f"{rename['section_id']}:{rename['old_id']}"},
+                {"$set": {"old_id": rename["old_id"], "new_id": rename["new_id"],
+                          "section_id": rename["section_id"], "expires_at": expires_at},
+                 "$setOnInsert": {"created_at": datetime.utcnow()}},
+                upsert=True,
+            )
+
+        for rename in RENAMES:
+            result = await db.problems.update_one(
+                {"id": rename["old_id"], "section_id": rename["section_id"]},
+                {"$set": {"id": rename["new_id"]}},
+            )
+            print(f"✅ Updated problem {rename['old_id']} -> {rename['new_id']}: {result.modified_count} documents")
+
+        # Workers pick up the rename map and drop cached payloads on the version bump
+        await db.catalog_meta.update_one({"_id": "curriculum"}, {"$inc": {"catalog_version": 1}}, upsert=True)
+
+    def source(self, db, lower, upper, after):
+        # Only students that still have rows under an old id, with just the fields needed to merge,
+        # and students whose progress document still has an entry under one (read per student)
+        match = {**old_rows_query(), **range_query("student_username", lower, upper, after)}
+        return db[ROWS_COLLECTION].aggregate([
+            {"$match": match},
+            {"$project": {"_id": 0, "student_username": 1, "row": {
+                "_id": "$_id", "problem_id": "$problem_id", "section_id": "$section_id",
+                "completed": "$completed", "score": "$score", "attempts": "$attempts",
+                "hints_used": "$hints_used",
+            }}},
+            {"$unionWith": {"coll": DOCUMENTS_COLLECTION, "pipeline": [
+                {"$match": {**old_documents_query(), **range_query("_id", lower, upper, after)}},
+                {"$project": {"_id": 0, "student_username": "$_id", "document": {"$literal": True}}},
+            ]}},
+            # $push skips the missing rows of documents; document stays null for students without one
+            {"$group": {"_id": "$student_username", "old_rows": {"$push": "$row"}, "document": {"$max": "$document"}}},
+            {"$sort": {"_id": 1}},
+        ], allowDiskUse=True)
+
+    def key(self, student):
+        return student["_id"]
+
+    async def operations(self, db, student):
+        username = student["_id"]
+        operations = []
+        if student["old_rows"]:
+            operations, merged = await row_rename_operations(db, username, student["old_rows"])
+            self.merged += merged
+        if student["document"]:
+            document_operations, merged = await document_rename_operations(db, username)
+            operations += document_operations
+            self.merged_entries += merged
+        return operations
+
+    def describe(self, student, operations):
+        renamed = [row["problem_id"] for row in student["old_rows"]]
+        document = " and progress document" if student["document"] else ""
+        return f"{student['_id']}: rename {renamed}{document}"
+
+    async def verify(self, db, args):
+        after = await self._count(db)
+        renamed = after["new_rows"] - self.counts["new_rows"]
+        print(f"Progress rows with old ids: {after['old_rows']}, with new ids: {after['new_rows']}")
+        print(f"Progress documents with old ids: {after['old_documents']}")
+        print(f"Renamed {renamed} rows, merged {self.merged} duplicates and {self.merged_entries} document entries")
+
+        problems_left = await db.problems.count_documents(
+            {"$or": [{"id": r["old_id"], "section_id": r["section_id"]} for r in RENAMES]}
         )
-        print(f"✅ Updated practice2 -> practice1_2: {result2.modified_count} documents")
-        
-        # Also fix any progress tracking that might reference old IDs
-        progress_collection = db.student_progress
-        
-        # This would need to be done for each student, but for now just log
-        print("⚠️  Note: You may also need to update student progress records")
-        print("⚠️  that reference 'practice1' and 'practice2' to use new naming")
-        
-        print("🎉 Migration completed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Error during migration: {e}")
-    finally:
-        if 'client' in locals():
-            client.close()
+        if (after["old_rows"] or after["old_documents"] or problems_left
+                or renamed + self.merged != self.counts["old_rows"]):
+            raise SystemExit(
+                f"❌ Verification failed: {after['old_rows']} progress rows, {after['old_documents']} progress "
+                f"documents and {problems_left} problems still use old ids, "
+                f"{renamed + self.merged} of {self.counts['old_rows']} rows accounted for"
+            )
+        print("🎉 Migration verified!")
 
 if __name__ == "__main__":
-    fix_problem_naming()
\ No newline at end of file
+    run_cli(FixProblemNaming())
@@ -1,108 +1,99 @@
-import pymongo
-from pymongo import MongoClient
+#!/usr/bin/env python3
+"""
+Fix the database issues left behind by the Section 1 -> Section 2 transition bug
+in the legacy student_progress layout (one document per student).
+
+The practice2 problems renamed here are renamed in each student's progress too,
+in the progress rows and progress_by_student documents alike (with the helpers
+of fix_database_naming.py), so no progress is left under an id that no longer
+exists.
+
+Usage:
+    MONGO_URL=... DB_NAME=mathtutor python fix_section_transition.py --dry-run
+    MONGO_URL=... DB_NAME=mathtutor python fix_section_transition.py --yes
+    MONGO_URL=... DB_NAME=mathtutor python fix_section_transition.py --reset-student Somayya
+"""
+
+import asyncio
+import copy
 from datetime import datetime
 
-# IMPORTANT: Replace with your MongoDB connection string
-MONGO_URI = "your_mongodb_connection_string_here"
+from pymongo import UpdateOne
+from motor.motor_asyncio import AsyncIOMotorClient
 
-def fix_database_issues():
-    """Fix the database corruption issues after Section 1 completion"""
-    
-    try:
-        # Connect to MongoDB
-        client = MongoClient(MONGO_URI)
-        db = client.mathtutor
-        
-        print("Connected to MongoDB successfully!")
-        print("-" * 50)
-        
-        # Step 1: Check for corrupted student accounts
-        print("Step 1: Checking for corrupted student accounts...")
-        
-        students = db.students.find({})
-        corrupted_count = 0
-        
-        for student in students:
-            username = student.get('username', 'Unknown')
-            progress = db.student_progress.find_one({'student_id': student['_id']})
-            
-            if progress:
-                # Check if the progress data has any malformed entries
-                progress_data = progress.get('progress', {})
-                
-                # Look for the specific corruption pattern
-                if 'section1' in progress_data:
-                    section1_data = progress_data['section1']
-                    
-                    # Check if examprep1 is completed but prep2 doesn't exist
-                    if 'examprep1' in section1_data and section1_data['examprep1'].get('status') == 'complete':
-                        if 'prep2' in section1_data or 'section2' not in progress_data:
-                            print(f"  ⚠️  Found corrupted account: {username}")
-                            corrupted_count += 1
-                            
-                            # Fix the corruption
-                            if 'prep2' in section1_data:
-                                # Remove the incorrect prep2 from section1
-                                del progress_data['section1']['prep2']
-                            
-                            # Ensure section2 structure exists
-                            if 'section2' not in progress_data:
-                                progress_data['section2'] = {
-                                    'prep2': {
-                                        'status': 'not_started',
-                                        'completed': False,
-                                        'score': 0,
-                                        'attempts': 0,
-                                        'last_attempt': None
-                                    }
-                                }
-                            
-                            # Update the database
-                            db.student_progress.update_one(
-                                {'_id': progress['_id']},
-                                {'$set': {'progress': progress_data}}
-                            )
-                            print(f"  ✅ Fixed corruption for: {username}")
-        
-        print(f"\nTotal corrupted accounts found: {corrupted_count}")
-        print(f"All corrupted accounts have been fixed!")
-        
-        print("-" * 50)
-        
-        # Step 2: Fix the problem ID naming inconsistencies
-        print("\nStep 2: Fixing problem ID naming inconsistencies...")
-        
-        # Fix duplicate practice2 IDs
-        problems_to_fix = [
-            {'section_id': 'section1', 'old_id': 'practice2', 'new_id': 'practice1_2'},
-            {'section_id': 'section2', 'old_id': 'practice2', 'new_id': 'practice2_2'},
-            {'section_id': 'section3', 'old_id': 'practice2', 'new_id': 'practice3_2'},
-            {'section_id': 'section4', 'old_id': 'practice2', 'new_id': 'practice4_2'},
-            {'section_id': 'section5', 'old_id': 'practice2', 'new_id': 'practice5_2'}
-        ]
-        
-        for fix in problems_to_fix:
-            result = db.problems.update_one(
+from repair_framework import Repair, confirm, parse_args, run_repair
+from fix_database_naming import document_rename_operations, old_rows_query, row_rename_operations
+from mongo_pool import client_options
+
+# Fix duplicate practice2 IDs
+PROBLEMS_TO_FIX = [
+    {'section_id': 'section1', 'old_id': 'practice2', 'new_id': 'practice1_2'},
+    {'section_id': 'section2', 'old_id': 'practice2', 'new_id': 'practice2_2'},
+    {'section_id': 'section3', 'old_id': 'practice2', 'new_id': 'practice3_2'},
+    {'section_id': 'section4', 'old_id': 'practice2', 'new_id': 'practice4_2'},
+    {'section_id': 'section5', 'old_id': 'practice2', 'new_id': 'practice5_2'}
+]
+
+SECTIONS = ['section1', 'section2', 'section3', 'section4', 'section5']
+
+def fixed_progress(progress_data):
+    """Return the repaired progress dict, or None when the student is not corrupted"""
+    # Look for the specific corruption pattern
+    section1_data = progress_data.get('section1')
+    if not section1_data:
+        return None
+
+    # Check if examprep1 is completed but prep2 doesn't exist
+    if not ('examprep1' in section1_data and section1_data['examprep1'].get('status') == 'complete'):
+        return None
+    if not ('prep2' in section1_data or 'section2' not in progress_data):
+        return None
+
+    progress_data = copy.deepcopy(progress_data)
+
+    # Remove the incorrect prep2 from section1
+    progress_data['section1'].pop('prep2', None)
+
+    # Ensure section2 structure exists
+    if 'section2' not in progress_data:
+        progress_data['section2'] = {
+            'prep2': {
+                'status': 'not_started',
+                'completed': False,
+                'score': 0,
+                'attempts': 0,
+                'last_attempt': None
+            }
+        }
+    return progress_data
+
+class FixSectionTransition(Repair):
+    name = "fix_section_transition"
+    description = "FAHHEMNI DATABASE FIX - section transition corruption"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset-student", metavar="USERNAME",
+                            help="Only reset the progress of this student")
+
+    async def setup(self, db, args):
+        if args.dry_run:
+            return
+
+        # Fix the problem ID naming inconsistencies
+        print("Fixing problem ID naming inconsistencies...")
+        for fix in PROBLEMS_TO_FIX:
+            result = await db.problems.update_one(
                 {'section_id': fix['section_id'], 'id': fix['old_id']},
                 {'$set': {'id': fix['new_id']}}
             )
             if result.modified_count > 0:
                 print(f"  ✅ Fixed: {fix['section_id']} - {fix['old_id']} → {fix['new_id']}")
-        
-        print("\nProblem ID naming has been standardized!")
-        
-        print("-" * 50)
-        
-        # Step 3: Add transition handler for section completions
-        print("\nStep 3: Adding section transition metadata...")
-        
+
         # Add metadata to track section transitions properly
-        sections = ['section1', 'section2', 'section3', 'section4', 'section5']
-        
-        for i, section in enumerate(sections):
-            next_section = sections[i + 1] if i < len(sections) - 1 else None
-            
-            db.sections.update_one(
+        print("Adding section transition metadata...")
+        for i, section in enumerate(SECTIONS):
+            next_section = SECTIONS[i + 1] if i < len(SECTIONS) - 1 else None
+            await db.sections.update_one(
                 {'id': section},
                 {
                     '$set': {
@@ -113,76 +104,78 @@ def fix_database_issues():
                 },
                 upsert=True
             )
-            print(f"  ✅ Updated transition metadata for {section}")
-        
-        print("\nSection transition metadata has been added!")
-        
-        print("-" * 50)
-        
-        # Step 4: Create indexes for better performance
-        print("\nStep 4: Creating database indexes for performance...")
-        
-        # Create indexes
-        db.students.create_index('username', unique=True)
-        db.student_progress.create_index('student_id')
-        db.problems.create_index([('section_id', 1), ('id', 1)])
-        db.sections.create_index('id', unique=True)
-        
-        print("  ✅ Indexes created successfully!")
-        
-        print("-" * 50)
-        print("\n🎉 DATABASE FIX COMPLETED SUCCESSFULLY!")
-        print("\nNext steps:")
-        print("1. Test with Somayya's account - it should now work")
-        print("2. Create a fresh test account to verify the fix")
-        print("3. Monitor the transition from Section 1 to Section 2")
-        
-        client.close()
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error occurred: {str(e)}")
-        print("\nPlease check:")
-        print("1. Your MongoDB connection string is correct")
-        print("2. Your database name is 'mathtutor'")
-        print("3. You have network connection to MongoDB Atlas")
-        return False
-
-def reset_specific_student(username):
+
+        # Create indexes for better performance
+        print("Creating database indexes...")
+        await db.students.create_index('username', unique=True)
+        await db.student_progress.create_index('student_id')
+        await db.problems.create_index([('section_id', 1), ('id', 1)])
+        await db.sections.create_index('id', unique=True)
+
+    async def operations(self, db, student):
+        username = student['username']
+        old_rows = await db.progress.find(
+            {'student_username': username, **old_rows_query(PROBLEMS_TO_FIX)},
+            {'problem_id': 1, 'section_id': 1, 'completed': 1, 'score': 1, 'attempts': 1, 'hints_used': 1}
+        ).to_list(None)
+        operations = []
+        if old_rows:
+            operations, _ = await row_rename_operations(db, username, old_rows, PROBLEMS_TO_FIX)
+        document_operations, _ = await document_rename_operations(db, username, PROBLEMS_TO_FIX)
+        operations += document_operations
+
+        progress = await db.student_progress.find_one({'student_id': student['_id']})
+        progress_data = fixed_progress(progress.get('progress', {})) if progress else None
+        if progress_data is not None:
+            operations.append(("student_progress", UpdateOne(
+                {'_id': progress['_id']},
+                {'$set': {'progress': progress_data, 'updated_at': datetime.now()}}
+            )))
+        return operations
+
+    def describe(self, student, operations):
+        fixes = []
+        if any(collection != "student_progress" for collection, _ in operations):
+            fixes.append("practice2 progress renamed")
+        if any(collection == "student_progress" for collection, _ in operations):
+            fixes.append("corrupted section 1 -> 2 transition")
+        return f"{student['username']}: {', '.join(fixes)}"
+
+async def reset_specific_student(args, username):
     """Reset a specific student's progress - use this if needed"""
+    client = AsyncIOMotorClient(args.mongo_url, **client_options())
+    db = client[args.db_name]
     try:
-        client = MongoClient(MONGO_URI)
-        db = client.mathtutor
-        
-        student = db.students.find_one({'username': username})
-        if student:
-            # Delete their progress
-            db.student_progress.delete_one({'student_id': student['_id']})
-            print(f"✅ Reset progress for student: {username}")
-            
-            # Create fresh progress entry
-            db.student_progress.insert_one({
+        student = await db.students.find_one({'username': username})
+        if not student:
+            print(f"❌ Student not found: {username}")
+            return
+
+        # Replace their progress with a fresh entry
+        await db.student_progress.replace_one(
+            {'student_id': student['_id']},
+            {
                 'student_id': student['_id'],
                 'progress': {},
                 'created_at': datetime.now(),
                 'updated_at': datetime.now()
-            })
-            print(f"✅ Created fresh progress entry for: {username}")
-        else:
-            print(f"❌ Student not found: {username}")
-        
+            },
+            upsert=True
+        )
+        print(f"✅ Reset progress for student: {username}")
+    finally:
         client.close()
-        
-    except Exception as e:
-        print(f"❌ Error resetting student: {str(e)}")
 
 if __name__ == "__main__":
+    repair = FixSectionTransition()
+    args = parse_args(repair)
+    print(repair.description)
     print("=" * 50)
-    print("FAHHEMNI DATABASE FIX SCRIPT")
-    print("=" * 50)
-    
-    # Run the main fix
-    fix_database_issues()
-    
-    # Uncomment this line if you need to reset a specific student
-    # reset_specific_student("Somayya")
\ No newline at end of file
+
+    if confirm(repair, args):
+        if args.reset_student:
+            asyncio.run(reset_specific_student(args, args.reset_student))
+        else:
+            asyncio.run(run_repair(repair, args))
+    else:
+        print("Cancelled.")
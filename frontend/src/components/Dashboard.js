@@ -7,6 +7,7 @@ import { Progress } from './ui/progress';
 import { Badge } from './ui/badge';
 import { Globe, LogOut, Trophy, Star, Medal, Crown, Play, Lock, CheckCircle, XCircle, ChevronRight, RotateCcw, BookOpen, HelpCircle } from 'lucide-react';
 import RulesModal from './RulesModal';
+import { fetchStudentProgress } from '../lib/progressSync';
 
 const Dashboard = () => { // <--- Component starts HERE
 
@@ -82,12 +83,9 @@ const Dashboard = () => { // <--- Component starts HERE
     try {
       setLoading(true);
 
-      const progressResponse = await fetch(
-        `${process.env.REACT_APP_BACKEND_URL}/api/students/${user.username}/progress`
-      );
+      const progressData = await fetchStudentProgress(user.username);
       
-      if (progressResponse.ok) {
-        const progressData = await progressResponse.json();
+      if (progressData) {
         setUserProgress(progressData.progress);
         setUserStats({
           totalPoints: progressData.total_points,
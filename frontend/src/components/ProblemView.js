@@ -11,6 +11,8 @@ import { useToast } from '../hooks/use-toast';
 import VoiceInput from './VoiceInput';
 import MathKeyboard from './MathKeyboard';
 import RulesModal from './RulesModal';
+import { fetchStudentProgress } from '../lib/progressSync';
+import { idempotentPost } from '../lib/idempotentPost';
 
 const ProblemView = () => {
   const { problemId } = useParams();
@@ -622,12 +624,9 @@ const ProblemView = () => {
       }
 
       // Fetch user progress
-      const progressResponse = await fetch(
-        `${process.env.REACT_APP_BACKEND_URL}/api/students/${user.username}/progress`
-      );
+      const progressData = await fetchStudentProgress(user.username);
       
-      if (progressResponse.ok) {
-        const progressData = await progressResponse.json();
+      if (progressData) {
         setUserProgress(progressData.progress);
         
         // CRITICAL: Check stage access security before allowing problem access
@@ -1275,18 +1274,12 @@ const ProblemView = () => {
       (stepAnswers[problem.step_solutions.length - 1] || userAnswer) : 
       (stepAnswers[0] || userAnswer);
       
-    const response = await fetch(
+    const response = await idempotentPost(
       `${process.env.REACT_APP_BACKEND_URL}/api/students/${user.username}/attempt`,
       {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          problem_id: problemId,
-          answer: userSubmittedAnswer, // FIXED: Send user's answer, not correct answer
-          hints_used: hintsUsed
-        }),
+        problem_id: problemId,
+        answer: userSubmittedAnswer, // FIXED: Send user's answer, not correct answer
+        hints_used: hintsUsed
       }
     );
 
@@ -1325,17 +1318,11 @@ const ProblemView = () => {
     
     try {
       // Update backend via API
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/updateProgress`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          username: user.username,
-          section: section,
-          stage: stage,
-          status: 'complete'
-        })
+      const response = await idempotentPost(`${process.env.REACT_APP_BACKEND_URL}/api/updateProgress`, {
+        username: user.username,
+        section: section,
+        stage: stage,
+        status: 'complete'
       });
       
       if (response.ok) {
@@ -1418,15 +1405,11 @@ const ProblemView = () => {
     
     // First, ensure the current stage is marked as complete
     try {
-        await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/updateProgress`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                username: user.username,
-                section: getCurrentSection().replace('section', ''),
-                stage: problemId,
-                status: 'complete'
-            })
+        await idempotentPost(`${process.env.REACT_APP_BACKEND_URL}/api/updateProgress`, {
+            username: user.username,
+            section: getCurrentSection().replace('section', ''),
+            stage: problemId,
+            status: 'complete'
         });
     } catch (error) {
         console.error('Error updating progress:', error);
@@ -23,11 +23,42 @@ const TeacherDashboard = () => {
     }
 
     fetchDashboardData(selectedClass);
+
+    // Live updates: the server pushes a student's recomputed row when their progress changes
+    const eventsUrl = selectedClass && selectedClass !== 'all'
+      ? `${process.env.REACT_APP_BACKEND_URL}/api/teacher/events?class_filter=${selectedClass}`
+      : `${process.env.REACT_APP_BACKEND_URL}/api/teacher/events`;
+    const events = new EventSource(eventsUrl);
+    events.addEventListener('student', (event) => {
+      const row = JSON.parse(event.data);
+      setDashboardData((current) => (current ? mergeStudentRow(current, row) : current));
+    });
+    // Sent when this dashboard fell behind - reload everything once
+    events.addEventListener('resync', () => fetchDashboardData(selectedClass, false));
+
+    return () => events.close();
   }, [user, isTeacher, navigate, selectedClass]);
 
-  const fetchDashboardData = async (classFilter = null) => {
+  // Same aggregates as /api/teacher/students, recomputed after one row changed
+  const mergeStudentRow = (data, row) => {
+    const exists = data.students.some((s) => s.username === row.username);
+    const students = exists
+      ? data.students.map((s) => (s.username === row.username ? row : s))
+      : [...data.students, row];
+    const total = students.length;
+    return {
+      ...data,
+      students,
+      total_students: total,
+      average_progress: Math.round(students.reduce((sum, s) => sum + s.progress_percentage, 0) / total),
+      completed_problems: students.reduce((sum, s) => sum + s.completed_problems, 0),
+      average_score: Math.round(students.reduce((sum, s) => sum + s.weighted_score, 0) / total)
+    };
+  };
+
+  const fetchDashboardData = async (classFilter = null, showLoading = true) => {
     try {
-      setLoading(true);
+      if (showLoading) setLoading(true);
       const url = classFilter && classFilter !== 'all' 
         ? `${process.env.REACT_APP_BACKEND_URL}/api/teacher/students?class_filter=${classFilter}`
         : `${process.env.REACT_APP_BACKEND_URL}/api/teacher/students`;
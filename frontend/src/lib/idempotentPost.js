@@ -0,0 +1,41 @@
+// POST that is safe to retry: every try of one call sends the same
+// Idempotency-Key, so the backend applies the request once and answers
+// the retries with the stored response
+const RETRY_DELAYS_MS = [500, 1500, 4000];
+
+function newKey() {
+  if (window.crypto && window.crypto.randomUUID) {
+    return window.crypto.randomUUID();
+  }
+  return `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+}
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+export async function idempotentPost(url, body) {
+  const request = {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Idempotency-Key': newKey(),
+    },
+    body: JSON.stringify(body),
+  };
+
+  for (let attempt = 0; ; attempt++) {
+    const lastTry = attempt === RETRY_DELAYS_MS.length;
+    try {
+      const response = await fetch(url, request);
+      // 409: the first try is still running; 5xx: it failed and released the key
+      if (lastTry || (response.status !== 409 && response.status < 500)) {
+        return response;
+      }
+    } catch (error) {
+      // Network error: the request may or may not have reached the backend
+      if (lastTry) {
+        throw error;
+      }
+    }
+    await sleep(RETRY_DELAYS_MS[attempt]);
+  }
+}
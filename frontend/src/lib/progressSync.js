@@ -0,0 +1,32 @@
+// Last full progress response per student; later fetches only ask for what changed
+const cache = {};
+
+function mergeProgress(progress, changes) {
+  const merged = { ...progress };
+  for (const [sectionId, problems] of Object.entries(changes)) {
+    merged[sectionId] = { ...merged[sectionId], ...problems };
+  }
+  return merged;
+}
+
+export async function fetchStudentProgress(username) {
+  const cached = cache[username];
+  const since = cached ? `?since=${cached.revision}` : '';
+  const response = await fetch(
+    `${process.env.REACT_APP_BACKEND_URL}/api/students/${username}/progress${since}`
+  );
+
+  if (response.status === 304 && cached) {
+    return cached;
+  }
+  if (!response.ok) {
+    return null;
+  }
+
+  const data = await response.json();
+  const result = data.partial && cached
+    ? { ...data, progress: mergeProgress(cached.progress, data.progress), partial: false }
+    : data;
+  cache[username] = result;
+  return result;
+}
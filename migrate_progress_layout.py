@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Copy progress rows into the one-document-per-student layout (progress_by_student).
+
+Students whose document already exists (created by the API on their first
+write with PROGRESS_LAYOUT=document) are left alone, so the script can run
+while the API is serving. The rows are kept; delete them only once the
+document layout has been in use for a while.
+
+Usage:
+    MONGO_URL=... DB_NAME=mathtutor python migrate_progress_layout.py --dry-run
+    MONGO_URL=... DB_NAME=mathtutor python migrate_progress_layout.py --workers 8 --yes
+"""
+
+from pymongo import UpdateOne
+
+from repair_framework import Repair, run_cli
+from progress_store import DOCUMENTS_COLLECTION, ROWS_COLLECTION, document_from_rows
+
+class MigrateProgressLayout(Repair):
+    name = "migrate_progress_layout"
+    description = "📦 Progress layout migration - one progress document per student"
+
+    async def operations(self, db, student):
+        username = student["username"]
+        rows = await db[ROWS_COLLECTION].find({"student_username": username}, {"_id": 0}).to_list(None)
+        if not rows:
+            return []
+        document = document_from_rows(username, rows)
+        return [(DOCUMENTS_COLLECTION, UpdateOne(
+            {"_id": username},
+            {"$setOnInsert": {k: v for k, v in document.items() if k != "_id"}},
+            upsert=True,
+        ))]
+
+    def describe(self, student, operations):
+        return f"{student['username']}: copy rows into one document"
+
+    async def verify(self, db, args):
+        students_with_rows = set(await db[ROWS_COLLECTION].distinct("student_username"))
+        documents = set(await db[DOCUMENTS_COLLECTION].distinct("_id"))
+        missing = students_with_rows - documents
+        print(f"Students with rows: {len(students_with_rows)}, with a progress document: {len(documents)}")
+        if missing:
+            raise SystemExit(f"❌ {len(missing)} students have rows but no document, e.g. {sorted(missing)[:5]}")
+        print("🎉 Migration verified! Set PROGRESS_LAYOUT=document on every worker.")
+
+if __name__ == "__main__":
+    run_cli(MigrateProgressLayout())
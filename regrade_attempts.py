@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Regrade logged attempts after an answer key or normalizer change.
+
+Every graded answer is kept in the attempts collection. For each student the
+logged attempts are replayed problem by problem against the current catalog
+(the problems collection) and utils.normalize_answer, with the rules of the
+attempt endpoint: a correct answer sets the score from calculate_score, and a
+problem stays completed once an answer was correct. Each problem's canonical
+answer is normalized once, and verdicts are shared between students who
+submitted the same string.
+
+Only completed, score and completed_at are corrected, and only where the log
+holds every attempt the progress row counts (rows older than the log are
+skipped). Changes that un-complete a problem or lower a score are only written
+with --allow-downgrades. Points and badges of changed students are recomputed
+and the class rollups are rebuilt at the end.
+
+Usage:
+    MONGO_URL=... DB_NAME=mathtutor python regrade_attempts.py --dry-run
+    MONGO_URL=... DB_NAME=mathtutor python regrade_attempts.py --problem practice2_1 --workers 8 --yes
+"""
+
+import time
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+
+from repair_framework import Repair, run_cli
+from grading import canonical_answer, grade_values
+from progress_store import DOCUMENTS_COLLECTION, ROWS_COLLECTION, progress_layout, rows_from_document
+from rewards import student_rewards
+from rollups import rebuild_class_rollups
+from utils import calculate_score
+
+ATTEMPTS_COLLECTION = "attempts"
+# Distinct (problem, answer) verdicts kept while the job runs
+VERDICT_CACHE_SIZE = 200_000
+
+class RegradeAttempts(Repair):
+    name = "regrade_attempts"
+    description = "🧮 Regrade logged attempts against the current answer keys"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--problem", action="append", help="Only regrade this problem id (repeatable)")
+        parser.add_argument("--allow-downgrades", action="store_true",
+                            help="Also write results that un-complete a problem or lower a score")
+
+    async def setup(self, db, args):
+        self.args = args
+        self.problems = {p["id"]: p for p in await db.problems.find({}, {"_id": 0, "id": 1, "type": 1, "answer": 1}).to_list(None)}
+        self.canonical = {problem_id: canonical_answer(p["type"], p["answer"]) for problem_id, p in self.problems.items()}
+        self.correct = lru_cache(maxsize=VERDICT_CACHE_SIZE)(self._correct)
+        self.started = time.monotonic()
+        self.attempts = 0
+        self.regraded_rows = 0
+        self.skipped_rows = 0
+        self.held_downgrades = 0
+
+    def _correct(self, problem_id: str, answer: str) -> bool:
+        problem = self.problems[problem_id]
+        return grade_values(problem["type"], problem["answer"], answer, self.canonical[problem_id])["correct"]
+
+    def replay(self, problem_id: str, attempts: List[Dict]) -> Dict:
+        completed, score, completed_at = False, 0, None
+        for number, attempt in enumerate(attempts, 1):
+            self.attempts += 1
+            if self.correct(problem_id, attempt["answer"]):
+                score = calculate_score(number, attempt.get("hints_used", 0), True)
+                if not completed:
+                    completed, completed_at = True, attempt["at"]
+        return {"completed": completed, "score": score, "completed_at": completed_at}
+
+    async def operations(self, db, student):
+        username = student["username"]
+        query = {"student_username": username}
+        if self.args.problem:
+            query["problem_id"] = {"$in": self.args.problem}
+        attempts = await db[ATTEMPTS_COLLECTION].find(query, {"_id": 0}).sort([("problem_id", 1), ("at", 1)]).to_list(None)
+        if not attempts:
+            return []
+
+        document = await db[DOCUMENTS_COLLECTION].find_one({"_id": username})
+        if document is not None:
+            rows = rows_from_document(document)
+        else:
+            rows = await db[ROWS_COLLECTION].find({"student_username": username}, {"_id": 0}).to_list(None)
+        by_problem = {row["problem_id"]: row for row in rows}
+
+        changes: Dict[str, Dict] = {}
+        for problem_id, logged in groupby(attempts, key=itemgetter("problem_id")):
+            logged = list(logged)
+            row = by_problem.get(problem_id)
+            if problem_id not in self.problems or row is None or row.get("attempts", 0) != len(logged):
+                self.skipped_rows += 1
+                continue
+            self.regraded_rows += 1
+
+            regraded = self.replay(problem_id, logged)
+            was_completed = bool(row.get("completed"))
+            if regraded["completed"] == was_completed and regraded["score"] == row.get("score", 0):
+                continue
+            if not self.args.allow_downgrades and (
+                (was_completed and not regraded["completed"]) or regraded["score"] < row.get("score", 0)
+            ):
+                self.held_downgrades += 1
+                continue
+
+            fields = {"completed": regraded["completed"], "score": regraded["score"]}
+            if regraded["completed"] != was_completed:
+                fields["completed_at"] = regraded["completed_at"]
+            changes[problem_id] = fields
+
+        if not changes:
+            return []
+        # Shown by describe() in --dry-run mode
+        student["_diff"] = [(problem_id, by_problem[problem_id], fields) for problem_id, fields in changes.items()]
+
+        # Delta sync clients see the regraded rows as changed. The revision is taken
+        # atomically, like database._next_progress_revision: the student read by the
+        # source cursor can be behind live writes that clients have already synced
+        if self.args.dry_run:
+            revision = student.get("progress_revision", 0) + 1
+        else:
+            revision = (await db.students.find_one_and_update(
+                {"username": username},
+                {"$inc": {"progress_revision": 1}},
+                projection={"progress_revision": 1},
+                return_document=ReturnDocument.AFTER,
+            ))["progress_revision"]
+        operations = []
+        if document is not None:
+            operations.append((DOCUMENTS_COLLECTION, UpdateOne({"_id": username}, {"$set": {
+                f"progress.{problem_id}.{field}": value
+                for problem_id, fields in changes.items()
+                for field, value in {**fields, "revision": revision}.items()
+            }})))
+        else:
+            operations += [
+                (ROWS_COLLECTION, UpdateOne(
+                    {"student_username": username, "problem_id": problem_id},
+                    {"$set": {**fields, "revision": revision}},
+                ))
+                for problem_id, fields in changes.items()
+            ]
+
+        regraded_rows = [{**row, **changes.get(row["problem_id"], {})} for row in rows]
+        operations.append(("students", UpdateOne(
+            {"username": username},
+            {"$set": student_rewards(regraded_rows)},
+        )))
+        return operations
+
+    def describe(self, student, operations):
+        return "; ".join(
+            f"{student['username']} {problem_id}: completed {bool(row.get('completed'))} -> {fields['completed']}, "
+            f"score {row.get('score', 0)} -> {fields['score']}"
+            for problem_id, row, fields in student["_diff"]
+        )
+
+    async def verify(self, db, args):
+        # Documents where they exist, else rows - where operations() wrote, whatever PROGRESS_LAYOUT is
+        classes = await rebuild_class_rollups(db, progress_layout(db, "document").iter_rows())
+        print(f"Class rollups rebuilt for {classes} classes")
+
+    def report(self) -> Optional[str]:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        cache = self.correct.cache_info()
+        lookups = cache.hits + cache.misses
+        return (f"Regraded {self.attempts} attempts ({self.attempts / elapsed:.0f}/s) in {self.regraded_rows} progress rows, "
+                f"{cache.misses} distinct answers normalized ({cache.hits / lookups * 100 if lookups else 0:.1f}% shared), "
+                f"{self.skipped_rows} rows skipped (incomplete log or unknown problem), "
+                f"{self.held_downgrades} downgrades held back" + ("" if self.args.allow_downgrades else " (write them with --allow-downgrades)"))
+
+if __name__ == "__main__":
+    run_cli(RegradeAttempts())
@@ -0,0 +1,254 @@
+"""
+Shared framework for the fix_* data repair scripts.
+
+A repair describes what to do for one item (usually one student); the
+framework takes care of the rest:
+- connection from MONGO_URL / DB_NAME, with the pool settings the API uses
+  (MONGO_MAX_POOL_SIZE, timeouts, ... see backend/mongo_pool.py)
+- a common CLI (--dry-run, --workers, --batch-size, --restart, --yes)
+- sharding the students by username range across asyncio workers
+- batched bulk_write calls per collection
+- per-shard checkpoints in the migrations_state collection, so a failed or
+  interrupted run restarts where it stopped instead of redoing work
+- throughput reporting
+
+Usage from a script:
+
+    class MyRepair(Repair):
+        name = "my_repair"
+        async def operations(self, db, student):
+            return [("progress", UpdateOne(...))]
+
+    if __name__ == "__main__":
+        run_cli(MyRepair())
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+from mongo_pool import client_options
+
+STATE_COLLECTION = "migrations_state"
+
+class Repair:
+    """Base class for a repair; subclasses override the hooks they need"""
+
+    name: str = None
+    description: str = ""
+    # Collection whose username field is used to shard the work
+    shard_collection = "students"
+    shard_field = "username"
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        """Add repair-specific command line options"""
+
+    async def setup(self, db, args):
+        """One-off work that runs before the sharded pass (catalog fixes, indexes, ...)"""
+
+    def source(self, db, lower: Optional[str], upper: Optional[str], after: Optional[str]) -> AsyncIterator[Dict]:
+        """Items of one shard in key order; by default the students in the username range"""
+        query = range_query(self.shard_field, lower, upper, after)
+        return db[self.shard_collection].find(query).sort(self.shard_field, 1)
+
+    def key(self, item: Dict) -> str:
+        """Checkpoint key of an item, must follow the source order"""
+        return item[self.shard_field]
+
+    async def operations(self, db, item: Dict) -> List[Tuple[str, object]]:
+        """Write operations for one item as (collection name, pymongo operation) pairs"""
+        return []
+
+    def describe(self, item: Dict, operations: List[Tuple[str, object]]) -> str:
+        """One line shown for every item that needs changes in --dry-run mode"""
+        return f"{self.key(item)}: {len(operations)} operation(s)"
+
+    async def verify(self, db, args):
+        """Checks run after a successful pass"""
+
+    def report(self) -> Optional[str]:
+        """Repair-specific counters printed after the throughput line"""
+
+def range_query(field: str, lower: Optional[str], upper: Optional[str], after: Optional[str]) -> Dict:
+    bounds = {}
+    if lower is not None:
+        bounds["$gte"] = lower
+    if upper is not None:
+        bounds["$lt"] = upper
+    if after is not None:
+        bounds["$gt"] = after
+    return {field: bounds} if bounds else {}
+
+class Stats:
+    """Throughput counters shared by all workers"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.items = 0
+        self.changed = 0
+        self.writes = 0
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (f"{self.items} items ({self.items / elapsed:.0f}/s), "
+                f"{self.changed} needing changes, {self.writes} documents written, {elapsed:.1f}s")
+
+async def compute_shards(db, repair: Repair, workers: int) -> List[Dict]:
+    """Split the key space into roughly equal username ranges"""
+    if workers <= 1:
+        return [{"lower": None, "upper": None, "last_key": None, "done": False}]
+
+    buckets = await db[repair.shard_collection].aggregate([
+        {"$bucketAuto": {"groupBy": f"${repair.shard_field}", "buckets": workers}},
+    ]).to_list(None)
+    boundaries = [bucket["_id"]["min"] for bucket in buckets[1:]]
+
+    lowers = [None] + boundaries
+    uppers = boundaries + [None]
+    return [
+        {"lower": lower, "upper": upper, "last_key": None, "done": False}
+        for lower, upper in zip(lowers, uppers)
+    ]
+
+async def _load_shards(db, repair: Repair, args) -> List[Dict]:
+    state = db[STATE_COLLECTION]
+    checkpoint = None if args.restart else await state.find_one({"_id": repair.name})
+    if checkpoint and checkpoint.get("shards") and not checkpoint.get("completed_at"):
+        pending = sum(1 for shard in checkpoint["shards"] if not shard["done"])
+        print(f"Resuming {repair.name}: {pending} of {len(checkpoint['shards'])} shards left")
+        return checkpoint["shards"]
+
+    shards = await compute_shards(db, repair, args.workers)
+    if not args.dry_run:
+        await state.replace_one(
+            {"_id": repair.name},
+            {"_id": repair.name, "shards": shards, "started_at": datetime.utcnow(), "completed_at": None},
+            upsert=True,
+        )
+    return shards
+
+async def _flush(db, pending: Dict[str, list], stats: Stats):
+    for collection, operations in pending.items():
+        if operations:
+            result = await db[collection].bulk_write(operations, ordered=False)
+            stats.writes += (result.inserted_count + result.upserted_count
+                             + result.modified_count + result.deleted_count)
+    pending.clear()
+
+async def _run_shard(db, repair: Repair, args, index: int, shard: Dict, stats: Stats):
+    state = db[STATE_COLLECTION]
+    pending: Dict[str, list] = defaultdict(list)
+    pending_count = 0
+    last_key = shard["last_key"]
+
+    async def checkpoint(done: bool = False):
+        nonlocal pending_count
+        await _flush(db, pending, stats)
+        pending_count = 0
+        await state.update_one(
+            {"_id": repair.name},
+            {"$set": {f"shards.{index}.last_key": last_key, f"shards.{index}.done": done,
+                      "updated_at": datetime.utcnow()}},
+        )
+
+    async for item in repair.source(db, shard["lower"], shard["upper"], shard["last_key"]):
+        operations = await repair.operations(db, item)
+        last_key = repair.key(item)
+        stats.items += 1
+
+        if operations:
+            stats.changed += 1
+            if args.dry_run:
+                print(f"  {repair.describe(item, operations)}")
+                continue
+            for collection, operation in operations:
+                pending[collection].append(operation)
+            pending_count += len(operations)
+
+        if not args.dry_run and pending_count >= args.batch_size:
+            await checkpoint()
+
+    if not args.dry_run:
+        await checkpoint(done=True)
+
+async def _report(stats: Stats, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        print(f"  ... {stats.line()}")
+
+async def run_repair(repair: Repair, args):
+    """Run setup, the sharded pass over all items and verification"""
+    client = AsyncIOMotorClient(args.mongo_url, **client_options())
+    db = client[args.db_name]
+    stats = Stats()
+    reporter = None
+    try:
+        await repair.setup(db, args)
+
+        shards = await _load_shards(db, repair, args)
+        reporter = asyncio.create_task(_report(stats, args.report_interval))
+        await asyncio.gather(*(
+            _run_shard(db, repair, args, index, shard, stats)
+            for index, shard in enumerate(shards)
+            if not shard["done"]
+        ))
+
+        if not args.dry_run:
+            await db[STATE_COLLECTION].update_one(
+                {"_id": repair.name}, {"$set": {"completed_at": datetime.utcnow()}}
+            )
+            await repair.verify(db, args)
+
+        print(f"{'Dry run' if args.dry_run else 'Done'}: {stats.line()}")
+        extra = repair.report()
+        if extra:
+            print(extra)
+        return stats
+    finally:
+        if reporter:
+            reporter.cancel()
+        client.close()
+
+def build_parser(repair: Repair) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=repair.description)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent shards")
+    parser.add_argument("--batch-size", type=int, default=500, help="Operations per bulk_write")
+    parser.add_argument("--restart", action="store_true", help="Ignore stored checkpoints")
+    parser.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    parser.add_argument("--report-interval", type=float, default=10, help="Seconds between progress lines")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL"), help="Defaults to $MONGO_URL")
+    parser.add_argument("--db-name", default=os.environ.get("DB_NAME", "mathtutor"), help="Defaults to $DB_NAME")
+    repair.add_arguments(parser)
+    return parser
+
+def parse_args(repair: Repair, argv=None):
+    args = build_parser(repair).parse_args(argv)
+    if not args.mongo_url:
+        sys.exit("Set MONGO_URL (and DB_NAME) or pass --mongo-url")
+    return args
+
+def confirm(repair: Repair, args) -> bool:
+    if args.dry_run or args.yes:
+        return True
+    response = input(f"This will run {repair.name} against {args.db_name}. Continue? (yes/no): ")
+    return response.lower() == 'yes'
+
+def run_cli(repair: Repair, argv=None):
+    """Entry point for fix_* scripts"""
+    args = parse_args(repair, argv)
+    print(repair.description or repair.name)
+    print("=" * 50)
+    if not confirm(repair, args):
+        print("Cancelled.")
+        return
+    asyncio.run(run_repair(repair, args))
@@ -0,0 +1,9 @@
+import os
+import sys
+from pathlib import Path
+
+# The backend modules import each other by name and read their settings at import
+# time; motor does not connect until the first query, so a placeholder URL is enough
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'mathtutor_test')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
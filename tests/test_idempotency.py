@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from pymongo.errors import AutoReconnect, DuplicateKeyError
+
+import idempotency
+from idempotency import IdempotencyKeys
+
+class FakeCollection:
+    """The idempotency_keys operations used by IdempotencyKeys, with injectable update failures"""
+
+    def __init__(self, failing_updates=0):
+        self.documents = {}
+        self.failing_updates = failing_updates
+
+    async def insert_one(self, document):
+        if document["_id"] in self.documents:
+            raise DuplicateKeyError("duplicate key")
+        self.documents[document["_id"]] = dict(document)
+
+    async def find_one(self, query):
+        document = self.documents.get(query["_id"])
+        return dict(document) if document else None
+
+    async def update_one(self, query, update):
+        if self.failing_updates:
+            self.failing_updates -= 1
+            raise AutoReconnect("connection reset")
+        self.documents[query["_id"]].update(update["$set"])
+
+    async def delete_one(self, query):
+        document = self.documents.get(query["_id"])
+        if document and document["status"] == query["status"]:
+            del self.documents[query["_id"]]
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(idempotency, "COMPLETE_RETRY_SECONDS", (0, 0, 0))
+
+def run_twice(keys, calls):
+    async def handler():
+        calls.append(1)
+        return {"attempts": len(calls)}
+
+    async def both():
+        first = await keys.run("attempt:ali", "k1", {"answer": "4"}, handler)
+        second = await keys.run("attempt:ali", "k1", {"answer": "4"}, handler)
+        return first, second
+
+    return asyncio.run(both())
+
+def test_retry_gets_the_first_response():
+    calls = []
+    first, second = run_twice(IdempotencyKeys(FakeCollection()), calls)
+    assert calls == [1]
+    assert first == {"attempts": 1}
+    assert second.headers["Idempotent-Replayed"] == "true"
+
+def test_response_is_stored_after_transient_write_errors():
+    collection = FakeCollection(failing_updates=2)
+    calls = []
+    first, _ = run_twice(IdempotencyKeys(collection), calls)
+    assert calls == [1]
+    assert first == {"attempts": 1}
+    assert collection.documents["attempt:ali:k1"]["status"] == "done"
+
+    # A worker without the response in memory replays it from the collection
+    calls.clear()
+    _, replayed = run_twice(IdempotencyKeys(collection), calls)
+    assert calls == []
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+
+def test_request_is_not_rerun_when_the_response_cannot_be_stored():
+    collection = FakeCollection(failing_updates=10)
+    calls = []
+    first, second = run_twice(IdempotencyKeys(collection), calls)
+    assert calls == [1]
+    assert first == {"attempts": 1}
+    assert second.headers["Idempotent-Replayed"] == "true"
+
+def test_failed_request_releases_the_key():
+    keys = IdempotencyKeys(FakeCollection())
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise ValueError("problem not found")
+
+    async def main():
+        with pytest.raises(ValueError):
+            await keys.run("attempt:ali", "k1", {"answer": "4"}, failing)
+        with pytest.raises(ValueError):
+            await keys.run("attempt:ali", "k1", {"answer": "4"}, failing)
+
+    asyncio.run(main())
+    assert calls == [1, 1]
@@ -0,0 +1,30 @@
+import time
+
+import pytest
+
+from benchmark import adversarial_answers
+from utils import MAX_ANSWER_LENGTH, normalize_answer
+
+# Same budget as `python benchmark.py normalize`: per answer of the maximum length, scaled linearly
+BUDGET_MS = 5
+# Best of a few runs, so a busy machine does not fail the check; backtracking is orders of magnitude slower
+RUNS = 3
+
+def best_ms(answer):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        normalize_answer(answer, "preparation", "x = 7")
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+@pytest.mark.parametrize("scale", [1, 10, 100])
+def test_adversarial_answers_normalize_within_budget(scale):
+    length = MAX_ANSWER_LENGTH * scale
+    over = [
+        f"{family}: {ms:.3f} ms"
+        for family, answer in adversarial_answers(length)
+        for ms in [best_ms(answer)]
+        if ms > BUDGET_MS * scale
+    ]
+    assert not over, f"Normalization over budget at {length} chars: " + "; ".join(over)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+import database
+
+# As published by fix_database_naming.py, plus an entry from before renames were keyed by section
+RENAMES = [
+    {"_id": "section1:practice1", "old_id": "practice1", "section_id": "section1", "new_id": "practice1_1"},
+    {"_id": "practice2", "section_id": "section1", "new_id": "practice1_2"},
+]
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length):
+        return list(self.documents)
+
+class FakeRenames:
+    def find(self, query):
+        return FakeCursor(RENAMES)
+
+class FakeProgressStore:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def read(self, username, problem_ids=None):
+        return [dict(row) for row in self.rows]
+
+    async def read_since(self, username, revision):
+        return [dict(row) for row in self.rows if row["revision"] > revision]
+
+def row(section_id, problem_id, revision=1):
+    return {"student_username": "ali", "section_id": section_id, "problem_id": problem_id,
+            "completed": True, "score": 100, "attempts": 1, "hints_used": 0, "revision": revision}
+
+@pytest.fixture(autouse=True)
+def renames(monkeypatch):
+    monkeypatch.setattr(database, "problem_id_renames_collection", FakeRenames())
+    asyncio.run(database.load_problem_id_renames())
+    yield
+    database._problem_id_renames.clear()
+
+def test_renames_are_keyed_by_section():
+    assert database._problem_id_renames == {
+        ("section1", "practice1"): "practice1_1",
+        ("section1", "practice2"): "practice1_2",
+    }
+    assert database.resolve_problem_id("practice2", "section1") == "practice1_2"
+    assert database.resolve_problem_id("practice2", "section2") == "practice2"
+
+def test_client_ids_resolve_when_one_section_renamed_them():
+    assert database.resolve_problem_id("practice2") == "practice1_2"
+    assert database.resolve_problem_id("practice2_2") == "practice2_2"
+
+def test_rows_of_other_sections_stay_untouched(monkeypatch):
+    monkeypatch.setattr(database, "progress_store", FakeProgressStore([
+        row("section1", "practice2"), row("section2", "practice2", revision=2),
+    ]))
+
+    progress = asyncio.run(database.get_student_progress("ali"))
+    assert [(p.section_id, p.problem_id) for p in progress] == [
+        ("section1", "practice1_2"), ("section2", "practice2"),
+    ]
+
+    changes = asyncio.run(database.get_progress_changes("ali", 1))
+    assert [(p.section_id, p.problem_id) for p in changes] == [("section2", "practice2")]
+
+def test_student_stats_keep_rows_of_other_sections():
+    rows = [row("section2", "practice2")]
+    database.student_stats({"username": "ali", "class_name": "GR9-A"}, rows, [])
+    assert rows[0]["problem_id"] == "practice2"